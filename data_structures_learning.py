@@ -4,6 +4,11 @@ Python Data Structures - Learning Program
 This program demonstrates various data structures in Python with detailed explanations.
 """
 
+import sys
+
+# The benchmarks only run with: python data_structures_learning.py --benchmark
+RUN_BENCHMARKS = "--benchmark" in sys.argv
+
 print("=" * 70)
 print("PYTHON DATA STRUCTURES - LEARNING PROGRAM")
 print("=" * 70)
@@ -283,40 +288,204 @@ print("-" * 70)
 print("""
 Queue is a linear data structure following FIFO principle.
 - Operations: enqueue (add to rear), dequeue (remove from front)
-- Can be implemented using list or collections.deque (more efficient)
+- Can be implemented using list, a circular buffer or collections.deque
+  (list.pop(0) is O(n); the other two dequeue in O(1))
 - Use cases: Task scheduling, BFS, print queues
 """)
 
+import threading
+import time
+
 class Queue:
-    def __init__(self):
-        self.items = []
+    """
+    FIFO queue on a growable circular buffer (ring buffer).
     
-    def enqueue(self, item):
-        """Add item to rear of queue"""
-        self.items.append(item)
+    Items live in a list used as a circle: head is the index of the front
+    item, and the rear is count places after it, wrapping around to the
+    start of the list. Dequeue only moves head forward, so it is O(1)
+    instead of the O(n) shifting done by list.pop(0). When the buffer is
+    full it doubles in size (amortized O(1) enqueue), up to capacity.
     
-    def dequeue(self):
-        """Remove and return front item"""
-        if self.is_empty():
-            return None
-        return self.items.pop(0)  # O(n) operation
+    Args:
+        capacity: Maximum number of items (None: unbounded)
+        blocking: If True, enqueue waits while the queue is full and
+            dequeue waits while it is empty (for producer/consumer threads)
+    """
+    
+    def __init__(self, capacity=None, blocking=False):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.buffer = [None] * min(8, capacity or 8)
+        self.head = 0   # Index of the front item
+        self.count = 0  # Number of items in the queue
+        self.condition = threading.Condition() if blocking else None
+    
+    def enqueue(self, item, timeout=None):
+        """Add item to rear of queue; return False if the queue is full"""
+        if self.condition is None:
+            return self.put(item)
+        
+        # Blocking: wait (up to timeout seconds) for a free slot
+        with self.condition:
+            if not self.condition.wait_for(self.has_room, timeout):
+                return False
+            self.put(item)
+            self.condition.notify_all()
+            return True
+    
+    def dequeue(self, timeout=None):
+        """Remove and return front item (None if the queue is empty)"""
+        if self.condition is None:
+            return self.take()
+        
+        # Blocking: wait (up to timeout seconds) for an item
+        with self.condition:
+            if not self.condition.wait_for(self.has_items, timeout):
+                return None
+            item = self.take()
+            self.condition.notify_all()
+            return item
+    
+    def enqueue_many(self, items, timeout=None):
+        """
+        Add several items at once; return how many were added.
+        
+        The items are copied into the buffer with at most two slice
+        assignments instead of one enqueue per item. Without blocking,
+        items that do not fit in the capacity are left out. With blocking,
+        it waits for room as needed (timeout applies to each wait).
+        """
+        items = list(items)
+        if self.condition is None:
+            return self.put_many(items)
+        
+        added = 0
+        with self.condition:
+            while added < len(items):
+                if not self.condition.wait_for(self.has_room, timeout):
+                    break
+                added += self.put_many(items[added:])
+                self.condition.notify_all()
+        return added
+    
+    def dequeue_many(self, n, timeout=None):
+        """
+        Remove and return up to n items from the front, as a list.
+        
+        With blocking, waits until at least one item is available.
+        """
+        if self.condition is None:
+            return self.take_many(n)
+        
+        with self.condition:
+            if not self.condition.wait_for(self.has_items, timeout):
+                return []
+            items = self.take_many(n)
+            self.condition.notify_all()
+            return items
     
     def front(self):
         """Return front item without removing"""
         if self.is_empty():
             return None
-        return self.items[0]
+        return self.buffer[self.head]
     
     def is_empty(self):
         """Check if queue is empty"""
-        return len(self.items) == 0
+        return self.count == 0
+    
+    def is_full(self):
+        """Check if queue has reached its capacity"""
+        return self.capacity is not None and self.count >= self.capacity
     
     def size(self):
         """Return size of queue"""
-        return len(self.items)
+        return self.count
+    
+    def __len__(self):
+        return self.count
+    
+    @property
+    def items(self):
+        """The items from front to rear, as a new list"""
+        first = min(self.count, len(self.buffer) - self.head)
+        return self.buffer[self.head:self.head + first] + self.buffer[:self.count - first]
     
     def __str__(self):
         return str(self.items)
+    
+    # Helpers working on the buffer (callers hold the lock when blocking)
+    
+    def has_room(self):
+        return not self.is_full()
+    
+    def has_items(self):
+        return self.count > 0
+    
+    def grow(self, needed):
+        """Make the buffer hold at least needed items, unrolling the circle"""
+        size = len(self.buffer)
+        if needed <= size:
+            return
+        while size < needed:
+            size *= 2
+        if self.capacity is not None:
+            size = min(size, self.capacity)
+        self.buffer = self.items + [None] * (size - self.count)
+        self.head = 0
+    
+    def put(self, item):
+        """Add one item to the rear if there is room"""
+        if self.is_full():
+            return False
+        self.grow(self.count + 1)
+        self.buffer[(self.head + self.count) % len(self.buffer)] = item
+        self.count += 1
+        return True
+    
+    def take(self):
+        """Remove the front item, or return None if empty"""
+        if self.count == 0:
+            return None
+        item = self.buffer[self.head]
+        self.buffer[self.head] = None  # Don't keep a reference to it
+        self.head = (self.head + 1) % len(self.buffer)
+        self.count -= 1
+        return item
+    
+    def put_many(self, items):
+        """Copy as many items as fit to the rear; return how many"""
+        room = len(items)
+        if self.capacity is not None:
+            room = min(room, self.capacity - self.count)
+        if room <= 0:
+            return 0
+        
+        self.grow(self.count + room)
+        size = len(self.buffer)
+        start = (self.head + self.count) % size
+        
+        # Fill up to the end of the list, then wrap around to the start
+        first = min(room, size - start)
+        self.buffer[start:start + first] = items[:first]
+        self.buffer[:room - first] = items[first:room]
+        self.count += room
+        return room
+    
+    def take_many(self, n):
+        """Remove up to n items from the front; return them as a list"""
+        n = max(0, min(n, self.count))
+        size = len(self.buffer)
+        first = min(n, size - self.head)
+        
+        items = self.buffer[self.head:self.head + first] + self.buffer[:n - first]
+        self.buffer[self.head:self.head + first] = [None] * first
+        self.buffer[:n - first] = [None] * (n - first)
+        
+        self.head = (self.head + n) % size
+        self.count -= n
+        return items
 
 # Using Queue
 queue = Queue()
@@ -329,6 +498,50 @@ print(f"Front element: {queue.front()}")
 dequeued = queue.dequeue()
 print(f"Dequeued: {dequeued}, Queue: {queue}")
 
+# Bounded queue with bulk operations
+bounded = Queue(capacity=4)
+added = bounded.enqueue_many(['a', 'b', 'c', 'd', 'e'])
+print(f"\nBounded queue (capacity 4) added {added} of 5: {bounded}")
+print(f"Dequeue 2 at once: {bounded.dequeue_many(2)}, Remaining: {bounded}")
+
+# Blocking queue shared by a producer thread and the main thread
+jobs = Queue(capacity=2, blocking=True)
+producer = threading.Thread(target=jobs.enqueue_many, args=(range(5),))
+producer.start()
+received = [jobs.dequeue(timeout=1) for _ in range(5)]
+producer.join()
+print(f"Blocking queue received from producer thread: {received}")
+
+def benchmark_queue(sizes=(10**3, 10**5), operations=10**4):
+    """
+    Time dequeue on queues already holding n items.
+    
+    Queue.dequeue costs the same at every size, while list.pop(0) gets
+    slower as the list grows (it shifts every remaining item).
+    """
+    print(f"\n{'Items':>10s} {'Queue (ns/op)':>15s} {'list.pop(0) (ns/op)':>21s}")
+    for n in sizes:
+        ring = Queue()
+        ring.enqueue_many(range(n))
+        dequeues = min(operations, n)
+        start = time.perf_counter()
+        for _ in range(dequeues):
+            ring.dequeue()
+        ring_ns = (time.perf_counter() - start) / dequeues * 1e9
+        
+        # list.pop(0) is only timed where it finishes in reasonable time
+        plain = list(range(n))
+        pops = min(operations, 1000)
+        start = time.perf_counter()
+        for _ in range(pops):
+            plain.pop(0)
+        list_ns = (time.perf_counter() - start) / pops * 1e9
+        
+        print(f"{n:>10d} {ring_ns:>15.1f} {list_ns:>21.1f}")
+
+if RUN_BENCHMARKS:
+    benchmark_queue(sizes=(10**3, 10**5, 10**7))
+
 # Using deque for efficient queue (recommended)
 from collections import deque
 efficient_queue = deque()
@@ -338,6 +551,375 @@ efficient_queue.append('task3')
 print(f"\nDeque queue: {list(efficient_queue)}")
 print(f"Dequeue: {efficient_queue.popleft()}, Remaining: {list(efficient_queue)}")
 
+# ============================================================================
+# 6b. CONCURRENT STACK AND QUEUE (threads and asyncio)
+# ============================================================================
+print("\n\n6b. CONCURRENT STACK AND QUEUE (threads and asyncio)")
+print("-" * 70)
+print("""
+Stack and the default (non-blocking) Queue above are not safe to share
+between threads, and nothing above works with asyncio coroutines.
+- ConcurrentStack / ConcurrentQueue: same API, safe between threads
+- Fast path without locks: deque.append/pop/popleft are atomic under the
+  GIL, so a lock is only taken to wait (blocking) or to enforce capacity
+- AsyncQueue: for asyncio coroutines, put/get are awaited and put waits
+  while the queue is full (backpressure)
+""")
+
+import asyncio
+
+class ConcurrentStack:
+    """Thread-safe LIFO stack on a deque, with the same API as Stack."""
+    
+    def __init__(self):
+        self.items = deque()
+    
+    def push(self, item):
+        """Add item to top of stack"""
+        self.items.append(item)  # Atomic: no lock needed
+    
+    def pop(self):
+        """Remove and return top item (None if empty)"""
+        # Checking is_empty() first would race with other threads;
+        # just try and handle the empty case
+        try:
+            return self.items.pop()
+        except IndexError:
+            return None
+    
+    def peek(self):
+        """Return top item without removing"""
+        try:
+            return self.items[-1]
+        except IndexError:
+            return None
+    
+    def is_empty(self):
+        """Check if stack is empty"""
+        return len(self.items) == 0
+    
+    def size(self):
+        """Return size of stack"""
+        return len(self.items)
+    
+    def __str__(self):
+        return str(list(self.items))
+
+class ConcurrentQueue:
+    """
+    Thread-safe FIFO queue with the same API as Queue.
+    
+    Items live in a deque, whose append and popleft are atomic under the
+    GIL. Unbounded enqueue and every dequeue that finds an item never take
+    a lock. The lock is only used by threads that have to wait (blocking
+    dequeue on an empty queue, enqueue on a full bounded queue); the other
+    side only takes it to wake them when someone is actually waiting.
+    
+    Args:
+        capacity: Maximum number of items (None: unbounded)
+        blocking: If True, enqueue waits while the queue is full and
+            dequeue waits while it is empty
+    """
+    
+    def __init__(self, capacity=None, blocking=False):
+        if capacity is not None and capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.blocking = blocking
+        self.queue = deque()
+        lock = threading.Lock()
+        self.not_empty = threading.Condition(lock)
+        self.not_full = threading.Condition(lock)
+        self.waiting_consumers = 0
+        self.waiting_producers = 0
+    
+    def enqueue(self, item, timeout=None):
+        """Add item to rear of queue; return False if the queue is full"""
+        if self.capacity is not None:
+            return self.put_bounded([item], timeout) == 1
+        self.queue.append(item)
+        self.wake(self.not_empty, self.waiting_consumers)
+        return True
+    
+    def dequeue(self, timeout=None):
+        """Remove and return front item (None if the queue is empty)"""
+        try:
+            item = self.queue.popleft()  # Fast path: no lock
+        except IndexError:
+            if not self.blocking:
+                return None
+            item = self.wait_for_item(timeout)
+            if item is None:
+                return None
+        self.wake(self.not_full, self.waiting_producers)
+        return item
+    
+    def enqueue_many(self, items, timeout=None):
+        """Add several items at once; return how many were added"""
+        items = list(items)
+        if self.capacity is not None:
+            return self.put_bounded(items, timeout)
+        self.queue.extend(items)
+        if items:
+            self.wake(self.not_empty, self.waiting_consumers, len(items))
+        return len(items)
+    
+    def dequeue_many(self, n, timeout=None):
+        """Remove and return up to n items from the front, as a list"""
+        items = []
+        if n > 0:
+            first = self.dequeue(timeout)
+            if first is None:
+                return items
+            items.append(first)
+        try:
+            while len(items) < n:
+                items.append(self.queue.popleft())
+        except IndexError:
+            pass
+        self.wake(self.not_full, self.waiting_producers, len(items))
+        return items
+    
+    def front(self):
+        """Return front item without removing"""
+        try:
+            return self.queue[0]
+        except IndexError:
+            return None
+    
+    def is_empty(self):
+        """Check if queue is empty"""
+        return len(self.queue) == 0
+    
+    def is_full(self):
+        """Check if queue has reached its capacity"""
+        return self.capacity is not None and len(self.queue) >= self.capacity
+    
+    def size(self):
+        """Return size of queue"""
+        return len(self.queue)
+    
+    def __len__(self):
+        return len(self.queue)
+    
+    @property
+    def items(self):
+        """The items from front to rear, as a new list"""
+        return list(self.queue)
+    
+    def __str__(self):
+        return str(self.items)
+    
+    # Slow paths (waiting threads)
+    
+    def wake(self, condition, waiting, n=1):
+        """Wake up to n waiting threads, taking the lock only if one is waiting"""
+        if waiting:
+            with condition:
+                condition.notify(n)
+    
+    def put_bounded(self, items, timeout):
+        """
+        Add items to a bounded queue, waiting for room if blocking.
+        
+        Producers hold the lock while checking the size and appending, so
+        together they never go over capacity. Consumers only make room.
+        Waiting consumers are woken after every batch, not only at the end,
+        or a producer waiting for room could wait on consumers that are
+        themselves waiting for items.
+        """
+        added = 0
+        with self.not_full:
+            self.waiting_producers += 1
+            try:
+                while added < len(items):
+                    room = self.capacity - len(self.queue)
+                    if room <= 0:
+                        if not self.blocking or not self.not_full.wait(timeout):
+                            break
+                        continue
+                    batch = items[added:added + room]
+                    self.queue.extend(batch)
+                    added += len(batch)
+                    if self.waiting_consumers:
+                        self.not_empty.notify(len(batch))
+            finally:
+                self.waiting_producers -= 1
+        return added
+    
+    def wait_for_item(self, timeout):
+        """Wait until an item can be taken; None if timeout passes first"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self.not_empty:
+            # Announce the wait before checking again, so a producer that
+            # appends after this check is sure to see us and notify
+            self.waiting_consumers += 1
+            try:
+                while True:
+                    try:
+                        return self.queue.popleft()
+                    except IndexError:
+                        pass
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return None
+                    self.not_empty.wait(remaining)
+            finally:
+                self.waiting_consumers -= 1
+
+class AsyncQueue:
+    """
+    FIFO queue for asyncio coroutines, with backpressure.
+    
+    await put(item) waits while the queue holds maxsize items, so fast
+    producers are slowed down to the pace of the consumers instead of
+    filling memory. await get() waits while the queue is empty. Built on
+    the ring-buffer Queue plus two asyncio.Conditions sharing one lock, so
+    each put wakes one getter and each get wakes one putter.
+    
+    Args:
+        maxsize: Maximum number of items (0: unbounded)
+    """
+    
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
+        self.queue = Queue(capacity=maxsize or None)
+        lock = asyncio.Lock()
+        self.not_empty = asyncio.Condition(lock)
+        self.not_full = asyncio.Condition(lock)
+    
+    async def put(self, item):
+        """Add item to rear of queue, waiting while it is full"""
+        async with self.not_full:
+            await self.not_full.wait_for(self.queue.has_room)
+            self.queue.put(item)
+            self.not_empty.notify()
+    
+    async def get(self):
+        """Remove and return front item, waiting while it is empty"""
+        async with self.not_empty:
+            await self.not_empty.wait_for(self.queue.has_items)
+            item = self.queue.take()
+            self.not_full.notify()
+            return item
+    
+    def is_empty(self):
+        """Check if queue is empty"""
+        return self.queue.is_empty()
+    
+    def is_full(self):
+        """Check if queue has reached maxsize"""
+        return self.queue.is_full()
+    
+    def size(self):
+        """Return size of queue"""
+        return self.queue.size()
+    
+    def __len__(self):
+        return self.queue.size()
+    
+    def __str__(self):
+        return str(self.queue)
+
+# Using ConcurrentStack and ConcurrentQueue from several threads
+shared_stack = ConcurrentStack()
+shared_queue = ConcurrentQueue(blocking=True)
+workers = [threading.Thread(target=shared_stack.push, args=(i,)) for i in range(4)]
+workers += [threading.Thread(target=shared_queue.enqueue, args=(i,)) for i in range(4)]
+for worker in workers:
+    worker.start()
+for worker in workers:
+    worker.join()
+print(f"ConcurrentStack pushed by 4 threads, size: {shared_stack.size()}")
+print(f"ConcurrentQueue drained: {sorted(shared_queue.dequeue_many(4))}")
+
+# Using AsyncQueue: a fast producer is held back by maxsize
+async def async_demo():
+    channel = AsyncQueue(maxsize=2)
+    largest = 0
+    
+    async def producer():
+        nonlocal largest
+        for i in range(5):
+            await channel.put(i)
+            largest = max(largest, channel.size())
+        await channel.put(None)  # Tell the consumer we are done
+    
+    async def consumer():
+        received = []
+        while (item := await channel.get()) is not None:
+            received.append(item)
+            await asyncio.sleep(0)
+        return received
+    
+    _, received = await asyncio.gather(producer(), consumer())
+    print(f"AsyncQueue received: {received}, never held more than {largest} items")
+
+asyncio.run(async_demo())
+
+def run_threads(queue, threads, items):
+    """Pass items through queue with the given number of producer and
+    consumer threads; return the elapsed seconds."""
+    share = items // threads
+    
+    def produce():
+        for i in range(share):
+            queue.enqueue(i)
+    
+    def consume():
+        for _ in range(share):
+            queue.dequeue()
+    
+    pool = [threading.Thread(target=produce) for _ in range(threads)]
+    pool += [threading.Thread(target=consume) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+def run_tasks(tasks, items):
+    """Pass items through an AsyncQueue with the given number of producer
+    and consumer tasks; return the elapsed seconds."""
+    share = items // tasks
+    
+    async def main():
+        channel = AsyncQueue(maxsize=1000)
+        
+        async def produce():
+            for i in range(share):
+                await channel.put(i)
+        
+        async def consume():
+            for _ in range(share):
+                await channel.get()
+        
+        await asyncio.gather(*[produce() for _ in range(tasks)],
+                             *[consume() for _ in range(tasks)])
+    
+    start = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - start
+
+def benchmark_contention(counts=(1, 4, 16, 64), items=64000):
+    """
+    Throughput (items per second) with 1-64 producers and as many consumers.
+    
+    Compares the blocking Queue (a lock on every operation), the
+    ConcurrentQueue (no lock unless a thread has to wait) and AsyncQueue
+    (coroutines instead of threads, maxsize 1000).
+    """
+    print(f"\n{'Producers':>10s} {'Queue':>12s} {'Concurrent':>12s} {'Async':>12s}   (items/s)")
+    for count in counts:
+        locked = items / run_threads(Queue(blocking=True), count, items)
+        lock_free = items / run_threads(ConcurrentQueue(blocking=True), count, items)
+        coroutines = items / run_tasks(count, items)
+        print(f"{count:>10d} {locked:>12.0f} {lock_free:>12.0f} {coroutines:>12.0f}")
+
+if RUN_BENCHMARKS:
+    benchmark_contention(items=640000)
+
 # ============================================================================
 # 7. LINKED LIST
 # ============================================================================
@@ -353,6 +935,10 @@ Linked List is a linear data structure with nodes connected by pointers.
 """)
 
 class Node:
+    # __slots__ stores the two attributes in fixed slots instead of a
+    # per-instance __dict__, which makes every node much smaller
+    __slots__ = ('data', 'next')
+    
     def __init__(self, data):
         self.data = data
         self.next = None
@@ -360,23 +946,52 @@ class Node:
 class LinkedList:
     def __init__(self):
         self.head = None
+        self.tail = None   # Last node, so append doesn't walk the list
+        self.length = 0    # Kept up to date, so len() is O(1)
+    
+    @classmethod
+    def from_iterable(cls, iterable):
+        """Build a linked list from any iterable in O(n)"""
+        linked_list = cls()
+        linked_list.extend(iterable)
+        return linked_list
+    
+    def __len__(self):
+        return self.length
     
     def append(self, data):
-        """Add node at the end"""
+        """Add node at the end (O(1) thanks to the tail pointer)"""
         new_node = Node(data)
         if self.head is None:
             self.head = new_node
-            return
-        last = self.head
-        while last.next:
-            last = last.next
-        last.next = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+    
+    def extend(self, iterable):
+        """Add all items of an iterable at the end"""
+        tail = self.tail
+        count = 0
+        for data in iterable:
+            new_node = Node(data)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        self.tail = tail
+        self.length += count
     
     def prepend(self, data):
         """Add node at the beginning"""
         new_node = Node(data)
         new_node.next = self.head
         self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.length += 1
     
     def display(self):
         """Display all nodes"""
@@ -394,12 +1009,18 @@ class LinkedList:
         
         if self.head.data == data:
             self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self.length -= 1
             return
         
         current = self.head
         while current.next:
             if current.next.data == data:
+                if current.next is self.tail:
+                    self.tail = current
                 current.next = current.next.next
+                self.length -= 1
                 return
             current = current.next
 
@@ -414,6 +1035,305 @@ print(f"Linked List: {ll.display()}")
 ll.delete(20)
 print(f"After deleting 20: {ll.display()}")
 
+ll.extend([40, 50])
+print(f"After extend([40, 50]): {ll.display()}, length: {len(ll)}")
+print(f"From iterable: {LinkedList.from_iterable('abc').display()}")
+
+import tracemalloc
+
+class DictNode:
+    """Node without __slots__ (like the original Node), for comparison"""
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+def benchmark_linked_list(n=10**5):
+    """
+    Memory per node with and without __slots__, and time to build n nodes.
+    """
+    print(f"\n{'Node class':>12s} {'Bytes/node':>12s}")
+    for node_class in (DictNode, Node):
+        tracemalloc.start()
+        nodes = [node_class(None) for _ in range(n)]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        # Subtract the list holding the nodes (one pointer per node)
+        per_node = (size - sys.getsizeof(nodes)) / n
+        print(f"{node_class.__name__:>12s} {per_node:>12.1f}")
+        del nodes
+    
+    print(f"\n{'Build ' + str(n) + ' nodes':>20s} {'Time (s)':>10s}")
+    start = time.perf_counter()
+    appended = LinkedList()
+    for i in range(n):
+        appended.append(i)
+    print(f"{'append':>20s} {time.perf_counter() - start:>10.3f}")
+    
+    start = time.perf_counter()
+    built = LinkedList.from_iterable(range(n))
+    print(f"{'from_iterable':>20s} {time.perf_counter() - start:>10.3f}")
+    assert len(appended) == len(built) == n
+
+if RUN_BENCHMARKS:
+    benchmark_linked_list(10**6)
+
+# ============================================================================
+# 7b. DOUBLY LINKED LIST AND LRU CACHE
+# ============================================================================
+print("\n\n7b. DOUBLY LINKED LIST AND LRU CACHE")
+print("-" * 70)
+print("""
+In a doubly linked list each node also points to the previous node.
+- Given a node (a "handle"), it can be unlinked or moved in O(1),
+  without searching for the node before it
+- LRU (Least Recently Used) cache: a dict maps keys to list nodes; every
+  hit moves its node to the front, so the back holds the entry to evict
+""")
+
+import functools
+import random
+from collections import OrderedDict
+
+class DNode:
+    __slots__ = ('data', 'prev', 'next')
+    
+    def __init__(self, data):
+        self.data = data
+        self.prev = None
+        self.next = None
+
+class DoublyLinkedList:
+    """
+    Doubly linked list whose insert methods return the new node, so the
+    caller can later unlink or move that node in O(1).
+    
+    A sentinel node sits between the back and the front (the list is a
+    circle through it), so inserting and unlinking never have to handle
+    an empty list or the ends specially.
+    """
+    
+    def __init__(self):
+        self.sentinel = DNode(None)
+        self.sentinel.prev = self.sentinel
+        self.sentinel.next = self.sentinel
+        self.length = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def __iter__(self):
+        current = self.sentinel.next
+        while current is not self.sentinel:
+            yield current.data
+            current = current.next
+    
+    def insert_after(self, node, new_node):
+        """Link new_node right after node"""
+        new_node.prev = node
+        new_node.next = node.next
+        node.next.prev = new_node
+        node.next = new_node
+        self.length += 1
+    
+    def prepend(self, data):
+        """Add data at the front; return its node"""
+        new_node = DNode(data)
+        self.insert_after(self.sentinel, new_node)
+        return new_node
+    
+    def append(self, data):
+        """Add data at the back; return its node"""
+        new_node = DNode(data)
+        self.insert_after(self.sentinel.prev, new_node)
+        return new_node
+    
+    def unlink(self, node):
+        """Remove node from the list in O(1)"""
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self.length -= 1
+    
+    def move_to_front(self, node):
+        """Move node to the front in O(1)"""
+        if self.sentinel.next is node:
+            return
+        self.unlink(node)
+        self.insert_after(self.sentinel, node)
+    
+    def pop_back(self):
+        """Remove and return the last node (None if empty)"""
+        node = self.sentinel.prev
+        if node is self.sentinel:
+            return None
+        self.unlink(node)
+        return node
+    
+    def display(self):
+        """Display all nodes"""
+        elements = [str(data) for data in self]
+        return ' <-> '.join(elements) if elements else 'Empty'
+
+class LRUCache:
+    """
+    Least Recently Used cache: when full, the entry unused the longest is evicted.
+    
+    A dict maps each key to its node in a DoublyLinkedList ordered from
+    most to least recently used, so get, put and eviction are all O(1).
+    
+    Args:
+        capacity: Maximum number of entries, or maximum total weight if a
+            weigher is given
+        weigher: Function returning the weight (e.g. size in bytes) of a
+            value; None counts every entry as 1
+    """
+    
+    def __init__(self, capacity, weigher=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.weigher = weigher
+        self.nodes = {}               # key -> node holding (key, value, weight)
+        self.order = DoublyLinkedList()
+        self.weight = 0               # Total weight of the cached entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key, default=None):
+        """Return the cached value (marking it as recently used) or default"""
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.move_to_front(node)
+        return node.data[1]
+    
+    def put(self, key, value):
+        """Cache value under key, evicting least recently used entries if needed"""
+        weight = 1 if self.weigher is None else self.weigher(value)
+        if weight > self.capacity:
+            # Would push out everything else and still not fit: don't cache
+            self.delete(key)
+            return
+        
+        node = self.nodes.get(key)
+        if node is None:
+            self.nodes[key] = self.order.prepend((key, value, weight))
+        else:
+            self.weight -= node.data[2]
+            node.data = (key, value, weight)
+            self.order.move_to_front(node)
+        self.weight += weight
+        
+        while self.weight > self.capacity:
+            evicted_key, _, evicted_weight = self.order.pop_back().data
+            del self.nodes[evicted_key]
+            self.weight -= evicted_weight
+            self.evictions += 1
+    
+    def delete(self, key):
+        """Remove key from the cache; return True if it was cached"""
+        node = self.nodes.pop(key, None)
+        if node is None:
+            return False
+        self.order.unlink(node)
+        self.weight -= node.data[2]
+        return True
+    
+    def __contains__(self, key):
+        # Doesn't count as a use: no stats, no change of order
+        return key in self.nodes
+    
+    def __len__(self):
+        return len(self.nodes)
+    
+    def stats(self):
+        """Return hits, misses, evictions, hit rate and current size"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.nodes),
+            'weight': self.weight,
+        }
+
+# Using DoublyLinkedList
+dll = DoublyLinkedList()
+first = dll.append(1)
+dll.append(2)
+third = dll.append(3)
+print(f"Doubly Linked List: {dll.display()}")
+dll.move_to_front(third)
+dll.unlink(first)
+print(f"After moving 3 to front and unlinking 1: {dll.display()}")
+
+# Using LRUCache
+cache = LRUCache(capacity=2)
+cache.put('a', 1)
+cache.put('b', 2)
+cache.get('a')          # 'a' is now the most recently used
+cache.put('c', 3)       # Evicts 'b', the least recently used
+print(f"\nLRU cache keys (most recent first): {[key for key, _, _ in cache.order]}")
+print(f"LRU stats: {cache.stats()}")
+
+# Weight-based eviction: capacity is the total length of the cached strings
+pages = LRUCache(capacity=10, weigher=len)
+for name, text in [('home', 'hello'), ('about', 'abc'), ('blog', 'post!')]:
+    pages.put(name, text)
+print(f"Weighted LRU keeps {[key for key, _, _ in pages.order]} (total weight {pages.weight})")
+
+def benchmark_lru(operations=10**5, capacity=1000, key_space=10000):
+    """
+    Lookups per second of LRUCache, an OrderedDict LRU and functools.lru_cache.
+    
+    Keys are skewed (a few keys are requested much more often than the
+    rest), like real cache traffic. Every miss stores the key's value.
+    """
+    rng = random.Random(0)
+    # random() ** 4 piles up near 0, so low keys are requested most often
+    keys = [int(key_space * rng.random() ** 4) for _ in range(operations)]
+    
+    def run_lru_cache():
+        cache = LRUCache(capacity)
+        for key in keys:
+            if cache.get(key) is None:
+                cache.put(key, key * 2)
+        return cache.stats()['hit_rate']
+    
+    def run_ordered_dict():
+        cache = OrderedDict()
+        hits = 0
+        for key in keys:
+            if key in cache:
+                cache.move_to_end(key)
+                hits += 1
+            else:
+                cache[key] = key * 2
+                if len(cache) > capacity:
+                    cache.popitem(last=False)
+        return hits / operations
+    
+    def run_functools():
+        cached = functools.lru_cache(maxsize=capacity)(lambda key: key * 2)
+        for key in keys:
+            cached(key)
+        return cached.cache_info().hits / operations
+    
+    print(f"\n{'Cache':>20s} {'Lookups/s':>12s} {'Hit rate':>10s}")
+    for name, run in [('LRUCache', run_lru_cache), ('OrderedDict', run_ordered_dict),
+                      ('functools.lru_cache', run_functools)]:
+        start = time.perf_counter()
+        hit_rate = run()
+        elapsed = time.perf_counter() - start
+        print(f"{name:>20s} {operations / elapsed:>12.0f} {hit_rate:>10.2%}")
+
+if RUN_BENCHMARKS:
+    benchmark_lru(10**6)
+
 # ============================================================================
 # 8. BINARY TREE
 # ============================================================================
@@ -429,6 +1349,8 @@ Binary Tree is a hierarchical data structure.
 """)
 
 class TreeNode:
+    __slots__ = ('data', 'left', 'right')
+    
     def __init__(self, data):
         self.data = data
         self.left = None
@@ -500,6 +1422,276 @@ for value in [1, 2, 3, 4, 5]:
 print("Binary Tree Traversals:")
 bt.display_traversals()
 
+# ============================================================================
+# 8b. SELF-BALANCING BINARY SEARCH TREE (AVL Tree)
+# ============================================================================
+print("\n\n8b. SELF-BALANCING BINARY SEARCH TREE (AVL Tree)")
+print("-" * 70)
+print("""
+A Binary Search Tree (BST) keeps keys ordered: smaller keys go left,
+larger keys go right, so a search only follows one path down.
+- If keys arrive in sorted order a plain BST becomes a linked list (O(n))
+- An AVL tree keeps the heights of every node's two subtrees within 1 of
+  each other by rotating nodes after inserts and deletes
+- Height stays O(log n), so insert, delete and search are O(log n)
+- Being ordered, it also answers floor/ceil and range queries
+""")
+
+class AVLNode:
+    __slots__ = ('key', 'value', 'left', 'right', 'height')
+    
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+def height(node):
+    """Height of a subtree (0 for an empty one)"""
+    return node.height if node else 0
+
+def update_height(node):
+    node.height = 1 + max(height(node.left), height(node.right))
+
+def balance_factor(node):
+    """Left height minus right height; AVL keeps it in -1, 0 or 1"""
+    return height(node.left) - height(node.right)
+
+def rotate_right(node):
+    """
+        node          left
+        /  \\          /  \\
+      left  C  ->    A   node
+      /  \\               /  \\
+     A    B             B    C
+    """
+    left = node.left
+    node.left = left.right
+    left.right = node
+    update_height(node)
+    update_height(left)
+    return left
+
+def rotate_left(node):
+    """Mirror image of rotate_right"""
+    right = node.right
+    node.right = right.left
+    right.left = node
+    update_height(node)
+    update_height(right)
+    return right
+
+def rebalance(node):
+    """Restore the AVL balance of node after one of its subtrees changed"""
+    update_height(node)
+    balance = balance_factor(node)
+    
+    if balance > 1:                              # Left side too tall
+        if balance_factor(node.left) < 0:        # Left-Right case
+            node.left = rotate_left(node.left)
+        return rotate_right(node)
+    if balance < -1:                             # Right side too tall
+        if balance_factor(node.right) > 0:       # Right-Left case
+            node.right = rotate_right(node.right)
+        return rotate_left(node)
+    return node
+
+class AVLTreeMap:
+    """
+    Ordered map (key -> value) on an AVL tree.
+    
+    insert, delete, search, floor and ceil are O(log n); range iterates
+    over the keys between two bounds in order in O(log n + k) for k keys.
+    """
+    
+    def __init__(self):
+        self.root = None
+        self.length = 0
+    
+    def __len__(self):
+        return self.length
+    
+    def __contains__(self, key):
+        return self.find_node(key) is not None
+    
+    def __getitem__(self, key):
+        node = self.find_node(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+    
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+    
+    def __delitem__(self, key):
+        if not self.delete(key):
+            raise KeyError(key)
+    
+    def __iter__(self):
+        for key, _ in self.range():
+            yield key
+    
+    def find_node(self, key):
+        """Walk down from the root to the node holding key (None if absent)"""
+        node = self.root
+        while node:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return None
+    
+    def search(self, key, default=None):
+        """Return the value stored for key, or default"""
+        node = self.find_node(key)
+        return default if node is None else node.value
+    
+    def insert(self, key, value=None):
+        """Insert key (or replace its value if it is already present)"""
+        self.root = self.insert_at(self.root, key, value)
+    
+    def insert_at(self, node, key, value):
+        """Insert into the subtree at node; return the subtree's new root"""
+        if node is None:
+            self.length += 1
+            return AVLNode(key, value)
+        if key < node.key:
+            node.left = self.insert_at(node.left, key, value)
+        elif node.key < key:
+            node.right = self.insert_at(node.right, key, value)
+        else:
+            node.value = value
+            return node
+        return rebalance(node)
+    
+    def delete(self, key):
+        """Remove key; return True if it was present"""
+        old_length = self.length
+        self.root = self.delete_at(self.root, key)
+        return self.length < old_length
+    
+    def delete_at(self, node, key):
+        """Delete from the subtree at node; return the subtree's new root"""
+        if node is None:
+            return None
+        if key < node.key:
+            node.left = self.delete_at(node.left, key)
+        elif node.key < key:
+            node.right = self.delete_at(node.right, key)
+        else:
+            if node.left is None or node.right is None:
+                # Zero or one child: the child takes the node's place
+                self.length -= 1
+                return node.left or node.right
+            # Two children: take over the next larger key, then delete
+            # that key from the right subtree
+            successor = node.right
+            while successor.left:
+                successor = successor.left
+            node.key = successor.key
+            node.value = successor.value
+            node.right = self.delete_at(node.right, successor.key)
+        return rebalance(node)
+    
+    def floor(self, key):
+        """Largest (key, value) with a key <= key, or None"""
+        best = None
+        node = self.root
+        while node:
+            if key < node.key:
+                node = node.left
+            else:
+                best = node
+                if not node.key < key:
+                    break  # Exact match
+                node = node.right
+        return (best.key, best.value) if best else None
+    
+    def ceil(self, key):
+        """Smallest (key, value) with a key >= key, or None"""
+        best = None
+        node = self.root
+        while node:
+            if node.key < key:
+                node = node.right
+            else:
+                best = node
+                if not key < node.key:
+                    break  # Exact match
+                node = node.left
+        return (best.key, best.value) if best else None
+    
+    def range(self, low=None, high=None):
+        """
+        Yield (key, value) pairs with low <= key <= high, in key order.
+        
+        None means no bound. Subtrees entirely outside the bounds are never
+        visited. Uses an explicit stack instead of recursion.
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            # Go as far left as the lower bound allows
+            while node:
+                if low is not None and node.key < low:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            node = stack.pop()
+            if high is not None and high < node.key:
+                return
+            yield node.key, node.value
+            node = node.right
+    
+    def items(self):
+        """All (key, value) pairs in key order"""
+        return list(self.range())
+
+# Using AVLTreeMap
+index_map = AVLTreeMap()
+for key in [50, 20, 70, 10, 30, 60, 80, 40]:
+    index_map[key] = f"row{key}"
+
+print(f"Keys in order: {list(index_map)}")
+print(f"Search 30: {index_map.search(30)}, search 35: {index_map.search(35)}")
+print(f"Floor of 35: {index_map.floor(35)}, ceil of 35: {index_map.ceil(35)}")
+print(f"Range 25..60: {[key for key, _ in index_map.range(25, 60)]}")
+index_map.delete(20)
+print(f"After deleting 20: {list(index_map)}, height: {height(index_map.root)}")
+
+def benchmark_ordered_map(n=10**5, tree_n=2000):
+    """
+    Build time and height of AVLTreeMap with sorted keys (the worst case for
+    a plain BST), compared with the level-order BinaryTree.insert.
+    """
+    print(f"\n{'Structure':>12s} {'Keys':>9s} {'Build (s)':>10s} {'Height':>7s}")
+    
+    start = time.perf_counter()
+    tree = BinaryTree()
+    for key in range(tree_n):
+        tree.insert(key)
+    print(f"{'BinaryTree':>12s} {tree_n:>9d} {time.perf_counter() - start:>10.3f} {'-':>7s}")
+    
+    start = time.perf_counter()
+    avl = AVLTreeMap()
+    for key in range(n):
+        avl.insert(key)
+    build = time.perf_counter() - start
+    print(f"{'AVLTreeMap':>12s} {n:>9d} {build:>10.3f} {height(avl.root):>7d}")
+    
+    start = time.perf_counter()
+    for key in range(n):
+        avl.search(key)
+    per_lookup = (time.perf_counter() - start) / n * 1e6
+    print(f"AVLTreeMap lookup: {per_lookup:.2f} us, log2(n) = {n.bit_length()}")
+
+if RUN_BENCHMARKS:
+    benchmark_ordered_map(10**6)
+
 # ============================================================================
 # 9. GRAPH (Adjacency List)
 # ============================================================================
@@ -598,6 +1790,7 @@ Stack             |   Yes   |   Yes   |    Yes     |   No    | LIFO operations
 Queue             |   Yes   |   Yes   |    Yes     |   No    | FIFO operations
 Linked List       |   Yes   |   Yes   |    Yes     |   No    | Dynamic size
 Binary Tree       |   No    |   Yes   |    Yes     |   No    | Hierarchical data
+AVL Tree Map      |   Yes   |   Yes   |    No**    |   No    | Ordered lookups
 Graph             |   No    |   Yes   |    Yes     |   No    | Relationships
 
 * Python 3.7+ maintains insertion order
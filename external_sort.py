@@ -0,0 +1,194 @@
+"""
+External Sorting in Python
+Sorting files that are larger than the available memory
+
+How it works:
+1. Read the input in chunks that fit in the memory budget
+2. Sort each chunk in memory and write it to a temporary "run" file
+3. Merge the sorted runs (at most fan_in at a time) into the output
+
+Usage:
+    python external_sort.py input.txt output.txt --memory-mb 256 --fan-in 64
+    python external_sort.py input.bin output.bin --record-size 16
+"""
+
+import argparse
+import os
+import tempfile
+from functools import partial
+
+from sorting_algorithms import merge_many, sort
+
+
+# Default memory budget for one in-memory chunk (bytes)
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+# Default number of runs merged at once
+DEFAULT_FAN_IN = 64
+
+# Read/write buffer size for each run file during a merge (bytes)
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# Rough per-record memory cost of a bytes object and its list slot
+RECORD_OVERHEAD = 41
+
+
+def external_sort(input_path, output_path, memory_limit=DEFAULT_MEMORY_LIMIT,
+                  fan_in=DEFAULT_FAN_IN, record_size=None, key=None,
+                  tmp_dir=None, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Sort a file of records that may not fit in memory.
+    
+    Records are newline-delimited lines by default, or fixed-size binary
+    records when record_size is given. Records are compared as bytes
+    unless a key function is given. Stable: equal records keep their
+    input order.
+    
+    Args:
+        input_path: File to sort
+        output_path: File to write the sorted records to
+        memory_limit: Approximate bytes of records held in memory at once
+        fan_in: Maximum number of runs merged at once (at least 2)
+        record_size: Size of each binary record, or None for lines
+        key: Function computing the comparison key of each record (bytes)
+        tmp_dir: Directory for temporary run files (default: system temp)
+        buffer_size: Read/write buffer size per file during merges
+    
+    Returns:
+        Number of records written
+    """
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    if record_size is not None and record_size < 1:
+        raise ValueError("record_size must be positive")
+    
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as run_dir:
+        # Phase 1: split the input into sorted runs
+        runs = []
+        count = 0
+        with open(input_path, "rb", buffering=buffer_size) as infile:
+            for chunk in read_chunks(infile, memory_limit, record_size):
+                sort(chunk, key=key)
+                runs.append(write_run(chunk, run_dir, len(runs), buffer_size))
+                count += len(chunk)
+        
+        # Phase 2: merge groups of runs until one final merge is left
+        generation = 0
+        while len(runs) > fan_in:
+            merged = []
+            for start in range(0, len(runs), fan_in):
+                group = runs[start:start + fan_in]
+                path = os.path.join(run_dir, f"merge-{generation}-{start}.run")
+                merge_runs(group, path, record_size, key, buffer_size)
+                for run in group:
+                    os.remove(run)
+                merged.append(path)
+            runs = merged
+            generation += 1
+        
+        # Phase 3: final merge straight into the output file
+        merge_runs(runs, output_path, record_size, key, buffer_size)
+    
+    return count
+
+
+def read_chunks(infile, memory_limit, record_size=None):
+    """
+    Yield lists of records whose total size stays within memory_limit.
+    
+    Lines are returned with a trailing newline (added to the last line of
+    the file if it is missing), so runs and output stay line-delimited.
+    """
+    chunk = []
+    chunk_bytes = 0
+    
+    for record in iter_records(infile, record_size):
+        if record_size is None and not record.endswith(b"\n"):
+            record += b"\n"
+        
+        chunk.append(record)
+        chunk_bytes += len(record) + RECORD_OVERHEAD
+        
+        if chunk_bytes >= memory_limit:
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+    
+    if chunk:
+        yield chunk
+
+
+def iter_records(infile, record_size=None):
+    """
+    Iterate over the lines of a binary file, or over fixed-size records.
+    """
+    if record_size is None:
+        return iter(infile)
+    return iter(partial(read_record, infile, record_size), b"")
+
+
+def read_record(infile, record_size):
+    """Read one fixed-size record, rejecting a truncated last record."""
+    record = infile.read(record_size)
+    if record and len(record) != record_size:
+        raise ValueError(f"input size is not a multiple of record_size={record_size}")
+    return record
+
+
+def write_run(records, run_dir, index, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Write sorted records to a new run file and return its path.
+    """
+    path = os.path.join(run_dir, f"run-{index}.run")
+    with open(path, "wb", buffering=buffer_size) as run_file:
+        run_file.writelines(records)
+    return path
+
+
+def merge_runs(paths, output_path, record_size=None, key=None,
+               buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    K-way merge of sorted run files into output_path.
+    
+    Each run is read through its own buffer, so memory use is about
+    (len(paths) + 1) * buffer_size no matter how large the runs are.
+    merge_many takes from earlier runs on ties, which keeps it stable.
+    """
+    files = [open(path, "rb", buffering=buffer_size) for path in paths]
+    try:
+        streams = [iter_records(run_file, record_size) for run_file in files]
+        with open(output_path, "wb", buffering=buffer_size) as outfile:
+            outfile.writelines(merge_many(*streams, key=key))
+    finally:
+        for run_file in files:
+            run_file.close()
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Sort a file that may be larger than memory.")
+    parser.add_argument("input", help="file to sort")
+    parser.add_argument("output", help="where to write the sorted file")
+    parser.add_argument("--memory-mb", type=float,
+                        default=DEFAULT_MEMORY_LIMIT / (1024 * 1024),
+                        help="memory budget for each in-memory chunk, in MB")
+    parser.add_argument("--fan-in", type=int, default=DEFAULT_FAN_IN,
+                        help="maximum number of runs merged at once")
+    parser.add_argument("--record-size", type=int, default=None,
+                        help="sort fixed-size binary records of this many bytes "
+                             "instead of lines")
+    parser.add_argument("--tmp-dir", default=None,
+                        help="directory for temporary run files")
+    args = parser.parse_args(argv)
+    
+    count = external_sort(args.input, args.output,
+                          memory_limit=int(args.memory_mb * 1024 * 1024),
+                          fan_in=args.fan_in,
+                          record_size=args.record_size,
+                          tmp_dir=args.tmp_dir)
+    print(f"Sorted {count} records into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,8 @@ import numpy as np
 from collections import Counter
 import math
 
+from dataframe_sorting import sort_dataframe
+
 print("=" * 80)
 print("INFOSYS DATA SCIENCE INTERVIEW PROBLEMS")
 print("=" * 80)
@@ -535,7 +537,8 @@ def sql_operations(customers_df, orders_df):
     
     print("\n=== ORDER BY multiple columns ===")
     if 'Amount' in orders_df.columns:
-        sorted_orders = orders_df.sort_values(['Customer_ID', 'Amount'], ascending=[True, False])
+        # Encodes both columns into one key and argsorts once (stable, parallel for big tables)
+        sorted_orders = sort_dataframe(orders_df, ['Customer_ID', 'Amount'], ascending=[True, False])
         print("Orders sorted by Customer_ID and Amount (descending):")
         print(sorted_orders)
 
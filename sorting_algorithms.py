@@ -3,17 +3,41 @@ Sorting Algorithms in Python
 Complete implementations with detailed comments for beginners
 """
 
+import array
+import bisect
+import heapq
+import itertools
+import logging
+import operator
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from multiprocessing import shared_memory
 
-def bubble_sort(arr):
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional: array inputs fall back to pure Python
+    np = None
+
+
+def bubble_sort(arr, key=None, reverse=False):
     """
     Sort an array using Bubble Sort algorithm.
     
     Args:
         arr: List of comparable elements
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
     
     Returns:
         Sorted list (in-place modification)
     """
+    if key is not None or reverse:
+        return sort_by_key(arr, bubble_sort, key, reverse)
+    
     n = len(arr)  # Get the length of the array
     
     # Outer loop: number of passes needed
@@ -36,16 +60,21 @@ def bubble_sort(arr):
     return arr
 
 
-def selection_sort(arr):
+def selection_sort(arr, key=None, reverse=False):
     """
     Sort an array using Selection Sort algorithm.
     
     Args:
         arr: List of comparable elements
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
     
     Returns:
         Sorted list (in-place modification)
     """
+    if key is not None or reverse:
+        return sort_by_key(arr, selection_sort, key, reverse)
+    
     n = len(arr)  # Get the length of the array
     
     # Outer loop: traverse through all array elements
@@ -66,20 +95,28 @@ def selection_sort(arr):
     return arr
 
 
-def insertion_sort(arr):
+def insertion_sort(arr, low=0, high=None, key=None, reverse=False):
     """
     Sort an array using Insertion Sort algorithm.
     
     Args:
         arr: List of comparable elements
+        low: Starting index (default: 0)
+        high: Ending index (default: length - 1)
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
     
     Returns:
         Sorted list (in-place modification)
     """
-    n = len(arr)  # Get the length of the array
+    if key is not None or reverse:
+        return sort_by_key(arr, insertion_sort, key, reverse, low, high)
+    
+    if high is None:
+        high = len(arr) - 1
     
-    # Start from the second element (index 1)
-    for i in range(1, n):
+    # Start from the second element of the range
+    for i in range(low + 1, high + 1):
         # Store the current element to be inserted
         key = arr[i]
         
@@ -87,7 +124,7 @@ def insertion_sort(arr):
         j = i - 1
         
         # Move elements that are greater than key one position ahead
-        while j >= 0 and arr[j] > key:
+        while j >= low and arr[j] > key:
             arr[j + 1] = arr[j]  # Shift element to the right
             j -= 1  # Move to the previous element
         
@@ -97,16 +134,21 @@ def insertion_sort(arr):
     return arr
 
 
-def merge_sort(arr):
+def merge_sort(arr, key=None, reverse=False):
     """
     Sort an array using Merge Sort algorithm.
     
     Args:
         arr: List of comparable elements
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
     
     Returns:
         New sorted list (does not modify original)
     """
+    if key is not None or reverse:
+        return sort_by_key(list(arr), merge_sort, key, reverse)
+    
     # Base case: if array has 0 or 1 element, it's already sorted
     if len(arr) <= 1:
         return arr
@@ -114,6 +156,10 @@ def merge_sort(arr):
     # Divide: find the middle point
     mid = len(arr) // 2
     
+    if active_metrics is not None:
+        active_metrics.allocations += 2  # The two half slices
+        active_metrics.moves += len(arr)  # Every element is copied into a half
+    
     # Conquer: recursively sort the two halves
     left_half = merge_sort(arr[:mid])      # Left half
     right_half = merge_sort(arr[mid:])     # Right half
@@ -133,6 +179,10 @@ def merge(left, right):
     Returns:
         Merged sorted array
     """
+    if active_metrics is not None:
+        active_metrics.allocations += 1
+        active_metrics.moves += len(left) + len(right)  # Every element is appended once
+    
     result = []  # Result array to store merged elements
     i = 0        # Index for left array
     j = 0        # Index for right array
@@ -159,25 +209,457 @@ def merge(left, right):
     return result
 
 
-def quick_sort(arr, low=0, high=None):
+def merge_sort_bottom_up(arr, in_place=False, key=None, reverse=False):
+    """
+    Sort an array using iterative (bottom-up) Merge Sort.
+    
+    Merges runs of width 1, 2, 4, ... back and forth between the list and
+    a single auxiliary buffer, so no slices or per-merge lists are created.
+    Stable, like merge_sort.
+    
+    Args:
+        arr: List of comparable elements
+        in_place: Sort arr itself instead of returning a new list
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
+    
+    Returns:
+        Sorted list (arr itself if in_place, otherwise a new list)
+    """
+    if key is not None or reverse:
+        return sort_by_key(arr if in_place else list(arr),
+                           merge_sort_bottom_up, key, reverse)
+    
+    n = len(arr)
+    
+    if active_metrics is not None:
+        active_metrics.allocations += 1 if in_place else 2
+        if not in_place:
+            active_metrics.moves += n  # The copy of arr
+    
+    # src holds the runs of the current width, dst receives the merged runs
+    src = arr if in_place else list(arr)
+    dst = [None] * n  # The only auxiliary buffer
+    
+    width = 1
+    while width < n:
+        # Merge each pair of neighbouring runs src[lo:mid] and src[mid:hi]
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            merge_into(src, dst, lo, mid, hi)
+        
+        # Each pass writes all n elements; writes into arr itself are
+        # already counted by instrument()'s MeteredList
+        if active_metrics is not None and dst is not arr:
+            active_metrics.moves += n
+        
+        # The merged runs become the input of the next pass
+        src, dst = dst, src
+        width *= 2
+    
+    # After an odd number of passes the result sits in the buffer
+    if in_place and src is not arr:
+        arr[:] = src
+        return arr
+    return src
+
+
+def merge_into(src, dst, lo, mid, hi):
+    """
+    Merge sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
+    
+    Args:
+        src: List holding the two sorted runs
+        dst: List receiving the merged run
+        lo: Start of the left run
+        mid: Start of the right run (end of the left run)
+        hi: End of the right run
+    """
+    i = lo   # Index in left run
+    j = mid  # Index in right run
+    k = lo   # Index in dst
+    
+    # Take from the left run on ties (<=) to keep the sort stable
+    while i < mid and j < hi:
+        if src[i] <= src[j]:
+            dst[k] = src[i]
+            i += 1
+        else:
+            dst[k] = src[j]
+            j += 1
+        k += 1
+    
+    # Copy whatever is left of either run
+    while i < mid:
+        dst[k] = src[i]
+        i += 1
+        k += 1
+    while j < hi:
+        dst[k] = src[j]
+        j += 1
+        k += 1
+
+
+# ============================================================================
+# Run-Aware Merge Sort (Timsort)
+# ============================================================================
+
+# Runs shorter than this never use galloping mode in merges
+MIN_GALLOP = 7
+
+
+def tim_sort(arr, key=None, reverse=False):
+    """
+    Sort an array using a Timsort-style natural merge sort.
+    
+    Finds the ascending and descending runs already in the input, extends
+    short runs to a minimum length with binary insertion sort, and merges
+    neighbouring runs with galloping. Nearly sorted input takes close to
+    O(n) time; the worst case is O(n log n). Stable.
+    
+    Args:
+        arr: List of comparable elements
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    if key is not None or reverse:
+        return sort_by_key(arr, tim_sort, key, reverse)
+    
+    n = len(arr)
+    if n < 2:
+        return arr
+    
+    min_run = compute_min_run(n)
+    runs = []  # Stack of [start, length] for runs waiting to be merged
+    
+    low = 0
+    while low < n:
+        # Find the natural run starting at low (descending runs get reversed)
+        run_length = count_run(arr, low, n)
+        
+        # Extend a short run to min_run elements with binary insertion
+        if run_length < min_run:
+            forced = min(min_run, n - low)
+            binary_insertion_sort(arr, low, low + forced, low + run_length)
+            run_length = forced
+        
+        runs.append([low, run_length])
+        merge_collapse(arr, runs)
+        low += run_length
+    
+    # Merge whatever runs are left, newest first
+    while len(runs) > 1:
+        merge_at(arr, runs, len(runs) - 2)
+    
+    return arr
+
+
+def compute_min_run(n):
+    """
+    Choose a minimum run length between 32 and 64 so that n / min_run
+    is close to (but not above) a power of two, keeping merges balanced.
+    """
+    extra = 0  # Becomes 1 if any bit shifted off is set
+    while n >= 64:
+        extra |= n & 1
+        n >>= 1
+    return n + extra
+
+
+def count_run(arr, low, high):
+    """
+    Return the length of the run starting at arr[low], within arr[low:high].
+    
+    A run is either non-decreasing or strictly decreasing. Strictly
+    decreasing runs are reversed in-place (strict, so it stays stable).
+    """
+    i = low + 1
+    if i == high:
+        return 1
+    
+    if arr[i] < arr[low]:
+        # Strictly descending run
+        while i + 1 < high and arr[i + 1] < arr[i]:
+            i += 1
+        arr[low:i + 1] = arr[low:i + 1][::-1]
+    else:
+        # Non-decreasing run
+        while i + 1 < high and not arr[i + 1] < arr[i]:
+            i += 1
+    
+    return i + 1 - low
+
+
+def binary_insertion_sort(arr, low, high, start):
+    """
+    Sort arr[low:high] given that arr[low:start] is already sorted.
+    
+    Uses binary search to find each insertion point, so it needs only
+    O(log n) comparisons per element.
+    """
+    for i in range(start, high):
+        item = arr[i]
+        
+        # Insert after any equal elements to keep the sort stable
+        position = bisect.bisect_right(arr, item, low, i)
+        
+        # Shift the larger elements one step right and drop item in place
+        arr[position + 1:i + 1] = arr[position:i]
+        arr[position] = item
+
+
+def merge_collapse(arr, runs):
+    """
+    Merge runs on the stack until the run lengths satisfy the invariants
+    runs[-3] > runs[-2] + runs[-1] and runs[-2] > runs[-1], which keeps
+    the merges balanced and the stack O(log n) deep.
+    """
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+            # Merge the middle run with its smaller neighbour
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        merge_at(arr, runs, n)
+
+
+def merge_at(arr, runs, i):
+    """
+    Merge the neighbouring runs runs[i] and runs[i + 1] of arr.
+    """
+    start, left_length = runs[i]
+    right_length = runs[i + 1][1]
+    mid = start + left_length
+    end = mid + right_length
+    
+    runs[i][1] = left_length + right_length
+    del runs[i + 1]
+    
+    # Elements of the left run not greater than the first right element
+    # are already in their final place
+    start = gallop_right(arr[mid], arr, start, mid)
+    if start == mid:
+        return
+    
+    # Likewise for right elements not less than the last left element
+    end = gallop_left(arr[mid - 1], arr, mid, end)
+    
+    merge_with_galloping(arr, start, mid, end)
+
+
+def merge_with_galloping(arr, start, mid, end):
+    """
+    Stable merge of arr[start:mid] and arr[mid:end], switching to galloping
+    mode when one run keeps winning.
+    
+    Only the left run is copied out; merged elements are written from the
+    left and can never overtake the unread part of the right run.
+    """
+    if active_metrics is not None:
+        active_metrics.allocations += 1
+        active_metrics.moves += mid - start
+    
+    left = arr[start:mid]  # Temporary copy of the left run
+    a = 0                  # Index in left
+    left_length = len(left)
+    b = mid                # Index in the right run (still inside arr)
+    k = start              # Next position to write in arr
+    
+    while a < left_length and b < end:
+        # One element at a time until a run wins MIN_GALLOP times in a row
+        left_wins = 0
+        right_wins = 0
+        while a < left_length and b < end:
+            if arr[b] < left[a]:
+                arr[k] = arr[b]
+                b += 1
+                right_wins += 1
+                left_wins = 0
+            else:
+                arr[k] = left[a]
+                a += 1
+                left_wins += 1
+                right_wins = 0
+            k += 1
+            if left_wins >= MIN_GALLOP or right_wins >= MIN_GALLOP:
+                break
+        
+        # Galloping: find how many elements in a row each run wins and
+        # copy them as one block
+        while a < left_length and b < end:
+            block_end = gallop_right(arr[b], left, a, left_length)
+            left_block = block_end - a
+            arr[k:k + left_block] = left[a:block_end]
+            k += left_block
+            a = block_end
+            if a == left_length:
+                break
+            
+            block_end = gallop_left(left[a], arr, b, end)
+            right_block = block_end - b
+            arr[k:k + right_block] = arr[b:block_end]
+            k += right_block
+            b = block_end
+            
+            # Galloping stopped paying off: go back to one at a time
+            if left_block < MIN_GALLOP and right_block < MIN_GALLOP:
+                break
+    
+    # Copy the rest of the left run; the rest of the right run is in place
+    arr[k:k + left_length - a] = left[a:]
+
+
+def gallop_left(key, arr, low, high):
+    """
+    Return the first index in arr[low:high] whose element is >= key.
+    
+    Searches at offsets 1, 3, 7, 15, ... from low before the final binary
+    search, so it is fast when the answer is near the start.
+    """
+    if low == high or not arr[low] < key:
+        return low
+    
+    last = low  # arr[last] < key is known
+    offset = 1
+    while low + offset < high and arr[low + offset] < key:
+        last = low + offset
+        offset = offset * 2 + 1
+    
+    return bisect.bisect_left(arr, key, last + 1, min(low + offset, high))
+
+
+def gallop_right(key, arr, low, high):
+    """
+    Return the first index in arr[low:high] whose element is > key.
+    
+    Like gallop_left, but equal elements are skipped over.
+    """
+    if low == high or key < arr[low]:
+        return low
+    
+    last = low  # arr[last] <= key is known
+    offset = 1
+    while low + offset < high and not key < arr[low + offset]:
+        last = low + offset
+        offset = offset * 2 + 1
+    
+    return bisect.bisect_right(arr, key, last + 1, min(low + offset, high))
+
+
+def quick_sort(arr, low=0, high=None, pivot="median", three_way=False,
+               block=False, key=None, reverse=False):
     """
     Sort an array using Quick Sort algorithm.
     
+    Uses an explicit stack instead of recursion. The smaller side of each
+    partition is always sorted first, so the stack never holds more than
+    O(log n) ranges, even on sorted or reversed input. Repeated keys are
+    handled like in introsort_loop: when a pivot equals the bound of its
+    range, a 3-way partition finishes all its copies at once.
+    
     Args:
         arr: List to be sorted (modified in-place)
         low: Starting index (default: 0)
         high: Ending index (default: length - 1)
+        pivot: Pivot strategy - "median" (median-of-three, ninther for
+            large ranges), "random" or "last" (default: "median")
+        three_way: Use 3-way partitioning, which finishes all elements
+            equal to the pivot in one pass (best for many duplicates)
+        block: Use block partitioning (see block_partition)
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
     """
+    if key is not None or reverse:
+        sort_by_key(arr, lambda items: quick_sort(items, pivot=pivot, three_way=three_way,
+                                                  block=block),
+                    key, reverse, low, high)
+        return
+    
     if high is None:
         high = len(arr) - 1
     
-    if low < high:
-        # Partition the array and get the pivot index
-        pivot_index = partition(arr, low, high)
+    # Stack of (low, high, bound) ranges still waiting to be sorted; bound
+    # is a value no element of the range is larger than (see introsort_loop)
+    stack = [(low, high, NO_BOUND)]
+    
+    while stack:
+        low, high, bound = stack.pop()
         
-        # Recursively sort elements before and after partition
-        quick_sort(arr, low, pivot_index - 1)   # Sort left subarray
-        quick_sort(arr, pivot_index + 1, high)  # Sort right subarray
+        while low < high:
+            # Move the chosen pivot to the end, where partition expects it
+            pivot_index = choose_pivot(arr, low, high, pivot)
+            arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+            
+            if three_way:
+                # arr[lt..gt] now holds every element equal to the pivot
+                lt, gt = partition_three_way(arr, low, high)
+            elif bound is not NO_BOUND and not arr[high] < bound:
+                # The pivot repeats the largest value in the range: put all
+                # its copies in place at the end and sort what is left
+                lt, _ = partition_three_way(arr, low, high)
+                high = lt - 1
+                continue
+            elif block:
+                lt = gt = block_partition(arr, low, high)
+            else:
+                # Partition the array and get the pivot index
+                lt = gt = partition(arr, low, high)
+            
+            # Elements equal to the pivot may end up on the left side, so
+            # the pivot bounds the left side from above
+            pivot_value = arr[lt]
+            
+            # Save the larger side for later and keep working on the smaller
+            if lt - low < high - gt:
+                stack.append((gt + 1, high, bound))
+                high = lt - 1
+                bound = pivot_value
+            else:
+                stack.append((low, lt - 1, pivot_value))
+                low = gt + 1
+
+
+# Ranges at least this long use the ninther instead of median-of-three
+NINTHER_THRESHOLD = 40
+
+
+def choose_pivot(arr, low, high, strategy="median"):
+    """
+    Pick the index of a pivot element in arr[low..high].
+    
+    Args:
+        arr: Array being sorted
+        low: Starting index
+        high: Ending index
+        strategy: "median", "random" or "last"
+    
+    Returns:
+        Index of the chosen pivot
+    """
+    if strategy == "last":
+        return high
+    if strategy == "random":
+        return random.randint(low, high)
+    if strategy != "median":
+        raise ValueError(f"Unknown pivot strategy: {strategy!r}")
+    
+    mid = (low + high) // 2
+    if high - low + 1 < NINTHER_THRESHOLD:
+        return median_of_three(arr, low, mid, high)
+    
+    # Ninther: median of the medians of three evenly spaced triples
+    step = (high - low + 1) // 8
+    first = median_of_three(arr, low, low + step, low + 2 * step)
+    middle = median_of_three(arr, mid - step, mid, mid + step)
+    last = median_of_three(arr, high - 2 * step, high - step, high)
+    return median_of_three(arr, first, middle, last)
 
 
 def partition(arr, low, high):
@@ -214,12 +696,121 @@ def partition(arr, low, high):
     return i + 1
 
 
+def partition_three_way(arr, low, high):
+    """
+    Partition the array into three parts around a pivot (Dutch national flag).
+    
+    Afterwards arr[low..lt-1] < pivot, arr[lt..gt] == pivot and
+    arr[gt+1..high] > pivot. Works in-place without extra lists.
+    
+    Args:
+        arr: Array to partition
+        low: Starting index
+        high: Ending index
+    
+    Returns:
+        Tuple (lt, gt) with the bounds of the elements equal to the pivot
+    """
+    # Choose the rightmost element as pivot, like partition
+    pivot = arr[high]
+    
+    lt = low   # Next position for an element smaller than the pivot
+    i = low    # Current element being examined
+    gt = high  # Next position (from the right) for a larger element
+    
+    while i <= gt:
+        if arr[i] < pivot:
+            # Smaller: swap it into the left part
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < arr[i]:
+            # Larger: swap it into the right part, then examine what came back
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            # Equal: leave it in the middle part
+            i += 1
+    
+    return lt, gt
+
+
+# Number of elements scanned per block by block_partition
+PARTITION_BLOCK_SIZE = 128
+
+
+def block_partition(arr, low, high):
+    """
+    Partition the array around arr[high] in blocks (BlockQuicksort).
+    
+    Instead of deciding "swap or not" for one element at a time, it scans
+    a whole block from each end, collects the offsets of the misplaced
+    elements into two small buffers, then swaps them pairwise in bulk.
+    The scan is a single comprehension with no data-dependent branching
+    in the loop body. Same contract as partition.
+    
+    Args:
+        arr: Array to partition
+        low: Starting index
+        high: Ending index (the pivot)
+    
+    Returns:
+        Index of the pivot after partitioning
+    """
+    pivot = arr[high]
+    block = PARTITION_BLOCK_SIZE
+    
+    left = low        # Start of the current left block
+    right = high - 1  # End of the current right block
+    
+    # Indices of misplaced elements still waiting for a partner
+    misplaced_left = []   # Elements >= pivot found on the left
+    misplaced_right = []  # Elements <= pivot found on the right
+    
+    # Stopping on equal elements on both sides keeps duplicates balanced
+    while right - left + 1 > 2 * block:
+        if not misplaced_left:
+            misplaced_left = [i for i, x in enumerate(arr[left:left + block], left)
+                              if not x < pivot]
+        if not misplaced_right:
+            misplaced_right = [right - i for i, x in enumerate(arr[right:right - block:-1])
+                               if not pivot < x]
+        
+        # Swap as many pairs as both buffers allow
+        count = min(len(misplaced_left), len(misplaced_right))
+        for i, j in zip(misplaced_left[:count], misplaced_right[:count]):
+            arr[i], arr[j] = arr[j], arr[i]
+        del misplaced_left[:count]
+        del misplaced_right[:count]
+        
+        # A block whose buffer is empty is fully partitioned
+        if not misplaced_left:
+            left += block
+        if not misplaced_right:
+            right -= block
+    
+    # Everything before left is <= pivot and everything after right is
+    # >= pivot; finish the middle with the simple Lomuto scheme
+    i = left - 1
+    for j in range(left, right + 1):
+        if arr[j] < pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+    
+    # Place pivot in its correct position
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+
 # Simple version of Quick Sort (easier to understand)
-def quick_sort_simple(arr):
+def quick_sort_simple(arr, key=None, reverse=False):
     """
     Simple version of Quick Sort that creates new arrays.
     Easier to understand but uses more memory.
     """
+    if key is not None or reverse:
+        return sort_by_key(list(arr), quick_sort_simple, key, reverse)
+    
     # Base case: arrays with 0 or 1 element are already sorted
     if len(arr) <= 1:
         return arr
@@ -227,6 +818,10 @@ def quick_sort_simple(arr):
     # Choose pivot (middle element)
     pivot = arr[len(arr) // 2]
     
+    if active_metrics is not None:
+        active_metrics.allocations += 3
+        active_metrics.moves += 2 * len(arr)  # Into the three lists, then into the result
+    
     # Partition into three lists
     less = [x for x in arr if x < pivot]      # Elements less than pivot
     equal = [x for x in arr if x == pivot]    # Elements equal to pivot
@@ -236,96 +831,2147 @@ def quick_sort_simple(arr):
     return quick_sort_simple(less) + equal + quick_sort_simple(greater)
 
 
-# Test function
-def test_all_algorithms():
-    """Test all sorting algorithms with sample data."""
-    
-    test_cases = [
-        [64, 34, 25, 12, 22, 11, 90],
-        [5, 2, 8, 1, 9],
-        [1],
-        [],
-        [3, 3, 3, 3],
-        [9, 8, 7, 6, 5, 4, 3, 2, 1],  # Reverse sorted
-    ]
-    
-    algorithms = {
-        "Bubble Sort": bubble_sort,
-        "Selection Sort": selection_sort,
-        "Insertion Sort": insertion_sort,
-        "Merge Sort": merge_sort,
-        "Quick Sort": quick_sort,
-    }
-    
-    for i, test_arr in enumerate(test_cases, 1):
-        print(f"\n{'='*60}")
-        print(f"Test Case {i}: {test_arr}")
-        print('='*60)
-        
-        for name, func in algorithms.items():
-            # Create a copy for testing (except merge_sort which returns new array)
-            if name == "Merge Sort":
-                result = func(test_arr.copy())
-                print(f"{name:20s}: {result}")
-            elif name == "Quick Sort":
-                arr_copy = test_arr.copy()
-                func(arr_copy)
-                print(f"{name:20s}: {arr_copy}")
-            else:
-                arr_copy = test_arr.copy()
-                func(arr_copy)
-                print(f"{name:20s}: {arr_copy}")
-
-
-if __name__ == "__main__":
-    print("Sorting Algorithms Test Suite")
-    print("="*60)
-    test_all_algorithms()
+def heap_sort(arr, low=0, high=None, key=None, reverse=False):
+    """
+    Sort an array using Heap Sort algorithm.
     
-    print("\n\n" + "="*60)
-    print("Individual Algorithm Examples")
-    print("="*60)
+    Args:
+        arr: List to be sorted (modified in-place)
+        low: Starting index (default: 0)
+        high: Ending index (default: length - 1)
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
     
-    # Example 1: Bubble Sort
-    numbers1 = [64, 34, 25, 12, 22, 11, 90]
-    print(f"\nBubble Sort:")
-    print(f"Original: {numbers1}")
-    bubble_sort(numbers1)
-    print(f"Sorted:   {numbers1}")
+    Returns:
+        Sorted list (in-place modification)
+    """
+    if key is not None or reverse:
+        return sort_by_key(arr, heap_sort, key, reverse, low, high)
     
-    # Example 2: Selection Sort
-    numbers2 = [64, 25, 12, 22, 11]
-    print(f"\nSelection Sort:")
-    print(f"Original: {numbers2}")
-    selection_sort(numbers2)
-    print(f"Sorted:   {numbers2}")
+    if high is None:
+        high = len(arr) - 1
     
-    # Example 3: Insertion Sort
-    numbers3 = [64, 34, 25, 12, 22, 11, 90]
-    print(f"\nInsertion Sort:")
-    print(f"Original: {numbers3}")
-    insertion_sort(numbers3)
-    print(f"Sorted:   {numbers3}")
+    n = high - low + 1  # Number of elements in the range
     
-    # Example 4: Merge Sort
-    numbers4 = [38, 27, 43, 3, 9, 82, 10]
-    print(f"\nMerge Sort:")
-    print(f"Original: {numbers4}")
-    sorted4 = merge_sort(numbers4)
-    print(f"Sorted:   {sorted4}")
-    print(f"Original unchanged: {numbers4}")
+    # Build a max-heap: sift down every parent, last parent first
+    for start in range(n // 2 - 1, -1, -1):
+        sift_down(arr, low, start, n)
     
-    # Example 5: Quick Sort
-    numbers5 = [10, 7, 8, 9, 1, 5]
-    print(f"\nQuick Sort:")
-    print(f"Original: {numbers5}")
-    quick_sort(numbers5)
-    print(f"Sorted:   {numbers5}")
+    # Repeatedly move the largest element to the end of the range
+    for end in range(n - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        sift_down(arr, low, 0, end)
     
-    # Example 6: Quick Sort Simple
-    numbers6 = [10, 7, 8, 9, 1, 5]
-    print(f"\nQuick Sort (Simple):")
-    print(f"Original: {numbers6}")
-    sorted6 = quick_sort_simple(numbers6)
-    print(f"Sorted:   {sorted6}")
+    return arr
+
 
+def sift_down(arr, offset, start, size):
+    """
+    Move arr[offset + start] down until the max-heap property holds.
+    
+    Args:
+        arr: Array holding the heap
+        offset: Index in arr where the heap begins
+        start: Heap position of the element to sift down
+        size: Number of elements in the heap
+    """
+    root = start
+    item = arr[offset + root]  # Element being moved down
+    
+    while True:
+        child = 2 * root + 1  # Left child
+        if child >= size:
+            break
+        
+        # Pick the larger of the two children
+        if child + 1 < size and arr[offset + child] < arr[offset + child + 1]:
+            child += 1
+        
+        # Stop once the item is not smaller than its larger child
+        if not item < arr[offset + child]:
+            break
+        
+        # Move the child up and continue from its position
+        arr[offset + root] = arr[offset + child]
+        root = child
+    
+    arr[offset + root] = item
+
+
+# ============================================================================
+# Hybrid Sort Engine (Introsort)
+# ============================================================================
+
+# Ranges this small are finished without partitioning (by a sorting
+# network in introsort, by insertion sort in nth_element)
+INSERTION_SORT_THRESHOLD = 16
+
+
+def sort(arr, key=None, reverse=False):
+    """
+    Sort an array with an adaptive hybrid (introsort) engine.
+    
+    Quick sort does most of the work, sorting networks finish small ranges,
+    and heap sort takes over when the recursion gets too deep, so the
+    worst case stays O(n log n). Already sorted or reversed input is
+    detected up front and handled in O(n). Large lists of plain ints within
+    a narrow range are handed to the linear-time numeric sorts instead (see
+    sort_numbers), and typed arrays to the vectorized backend (see
+    sort_array; with a key they are sorted as a list and written back).
+    
+    Args:
+        arr: List of comparable elements
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    # Typed arrays (array.array, memoryview, numpy) are sorted as a block
+    if is_buffer_array(arr):
+        return sort_array(arr, reverse=reverse, key=key)
+    
+    # Tiny lists go straight to an unrolled sorting network (isinstance, so
+    # the MeteredList used by instrument() takes the same path)
+    if key is None and not reverse and isinstance(arr, list) and len(arr) <= MAX_NETWORK_SIZE:
+        return network_sort(arr)
+    
+    # Numbers can skip comparisons entirely
+    if key is None and sort_numbers(arr, reverse):
+        return arr
+    
+    if key is not None or reverse:
+        return sort_by_key(arr, sort, key, reverse)
+    
+    introsort(arr)
+    return arr
+
+
+def sort_by_key(arr, sort_func, key=None, reverse=False, low=0, high=None):
+    """
+    Sort arr[low..high] by key with any of the sort functions in this module.
+    
+    Each key is computed once (decorate-sort-undecorate), not on every
+    comparison, so an expensive key function is called only n times.
+    The decorated items are (key, index) pairs: the index breaks ties, so
+    the elements themselves are never compared and every sort is stable.
+    
+    Args:
+        arr: List to be sorted (modified in-place)
+        sort_func: Function sorting a list of (key, index) pairs; may sort
+            in-place or return a new list
+        key: Function computing the comparison key of each element
+            (default: the element itself)
+        reverse: Sort in descending order if True
+        low: Starting index (default: 0)
+        high: Ending index (default: length - 1)
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    if high is None:
+        high = len(arr) - 1
+    
+    if active_metrics is not None:
+        active_metrics.allocations += 3  # items, decorated and sorted_items
+        active_metrics.moves += 2 * (high - low + 1)  # Copies into items and sorted_items
+    
+    # Work on a reversed copy so equal elements keep their original order
+    # once the result is reversed back for a descending sort
+    items = arr[low:high + 1]
+    if reverse:
+        items.reverse()
+    
+    # Decorate: compute every key exactly once
+    if key is None:
+        decorated = [(item, i) for i, item in enumerate(items)]
+    else:
+        decorated = [(key(item), i) for i, item in enumerate(items)]
+    
+    # Under instrument() each pair is metered as a whole: a tuple comparison
+    # would count the == and the < it makes on the keys as two comparisons
+    if active_metrics is not None:
+        decorated = MeteredList(MeteredValue((unwrap(k), i)) for k, i in decorated)
+    
+    # Sort the pairs; functions that sort in-place return None or the list
+    result = sort_func(decorated)
+    if result is None:
+        result = decorated
+    if active_metrics is not None:
+        result = [pair.value for pair in result]
+    
+    # Undecorate: pick the original elements in sorted order
+    sorted_items = [items[i] for _, i in result]
+    if reverse:
+        sorted_items.reverse()
+    arr[low:high + 1] = sorted_items
+    return arr
+
+
+def introsort(arr, low=0, high=None):
+    """
+    Sort arr[low..high] in-place using introsort.
+    
+    Args:
+        arr: List to be sorted (modified in-place)
+        low: Starting index (default: 0)
+        high: Ending index (default: length - 1)
+    """
+    if high is None:
+        high = len(arr) - 1
+    
+    if high <= low:
+        return
+    
+    # Already sorted or strictly reversed input needs no partitioning
+    if is_sorted_range(arr, low, high):
+        return
+    if is_strictly_descending_range(arr, low, high):
+        arr[low:high + 1] = arr[low:high + 1][::-1]
+        return
+    
+    # Allow about 2 * log2(n) levels of partitioning before giving up
+    depth_limit = 2 * (high - low + 1).bit_length()
+    introsort_loop(arr, low, high, depth_limit)
+
+
+# Marks a range with no known upper bound in quick_sort and introsort_loop
+NO_BOUND = object()
+
+
+def introsort_loop(arr, low, high, depth_limit, bound=NO_BOUND):
+    """
+    Partition arr[low..high] until ranges are small, then finish them.
+    
+    Only the smaller side of each partition is handled recursively and
+    the larger side is handled by the loop, so the stack stays O(log n).
+    
+    partition puts elements equal to the pivot on its left side, so every
+    left side is bounded above by the pivot that produced it. If a new
+    pivot equals that bound, the range holds many copies of it (as in
+    pdqsort): a 3-way partition then moves all of them into place at once
+    instead of splitting them again and again.
+    
+    Args:
+        arr: Array being sorted
+        low: Starting index
+        high: Ending index
+        depth_limit: Remaining partition levels before falling back to heap sort
+        bound: Value no element of the range is larger than (NO_BOUND if unknown)
+    """
+    while high - low + 1 > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            # Too many bad pivots: heap sort guarantees O(n log n)
+            heap_sort(arr, low, high)
+            return
+        depth_limit -= 1
+        
+        # Move the median pivot to the end so partition uses it
+        median = choose_pivot(arr, low, high)
+        arr[median], arr[high] = arr[high], arr[median]
+        
+        if bound is not NO_BOUND and not arr[high] < bound:
+            # The pivot repeats the bound, the largest value in the range:
+            # everything equal to it ends up in arr[lt..high], already in place
+            lt, _ = partition_three_way(arr, low, high)
+            high = lt - 1
+            continue
+        
+        pivot_index = partition(arr, low, high)
+        pivot = arr[pivot_index]
+        
+        # Recurse into the smaller side, loop on the larger side
+        if pivot_index - low < high - pivot_index:
+            introsort_loop(arr, low, pivot_index - 1, depth_limit, pivot)
+            low = pivot_index + 1
+        else:
+            introsort_loop(arr, pivot_index + 1, high, depth_limit, bound)
+            high = pivot_index - 1
+            bound = pivot
+    
+    # Finish the small range with a sorting network
+    arr[low:high + 1] = NETWORK_SORTS[high - low + 1](arr[low:high + 1])
+
+
+def median_of_three(arr, a, b, c):
+    """
+    Return whichever of the indices a, b, c holds the median value.
+    """
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def is_sorted_range(arr, low, high):
+    """Check whether arr[low..high] is in non-decreasing order."""
+    for i in range(low, high):
+        if arr[i + 1] < arr[i]:
+            return False
+    return True
+
+
+def is_strictly_descending_range(arr, low, high):
+    """Check whether arr[low..high] is in strictly decreasing order."""
+    for i in range(low, high):
+        if not arr[i + 1] < arr[i]:
+            return False
+    return True
+
+
+# ============================================================================
+# Sorting Networks (tiny fixed sizes)
+# ============================================================================
+
+# Optimal (n <= 12) or best known (n = 13..16) sorting networks. Each row is
+# one layer of independent comparators (i, j): if element j < element i,
+# they are exchanged. The same fixed sequence sorts every input of size n.
+SORTING_NETWORKS = {
+    2: [  # 1 comparator
+        (0, 1),
+    ],
+    3: [  # 3 comparators
+        (0, 2),
+        (0, 1),
+        (1, 2),
+    ],
+    4: [  # 5 comparators
+        (0, 2), (1, 3),
+        (0, 1), (2, 3),
+        (1, 2),
+    ],
+    5: [  # 9 comparators
+        (0, 3), (1, 4),
+        (0, 2), (1, 3),
+        (0, 1), (2, 4),
+        (1, 2), (3, 4),
+        (2, 3),
+    ],
+    6: [  # 12 comparators
+        (0, 5), (1, 3), (2, 4),
+        (1, 2), (3, 4),
+        (0, 3), (2, 5),
+        (0, 1), (2, 3), (4, 5),
+        (1, 2), (3, 4),
+    ],
+    7: [  # 16 comparators
+        (0, 6), (2, 3), (4, 5),
+        (0, 2), (1, 4), (3, 6),
+        (0, 1), (2, 5), (3, 4),
+        (1, 2), (4, 6),
+        (2, 3), (4, 5),
+        (1, 2), (3, 4), (5, 6),
+    ],
+    8: [  # 19 comparators
+        (0, 2), (1, 3), (4, 6), (5, 7),
+        (0, 4), (1, 5), (2, 6), (3, 7),
+        (0, 1), (2, 3), (4, 5), (6, 7),
+        (2, 4), (3, 5),
+        (1, 4), (3, 6),
+        (1, 2), (3, 4), (5, 6),
+    ],
+    9: [  # 25 comparators
+        (0, 3), (1, 7), (2, 5), (4, 8),
+        (0, 7), (2, 4), (3, 8), (5, 6),
+        (0, 2), (1, 3), (4, 5), (7, 8),
+        (1, 4), (3, 6), (5, 7),
+        (0, 1), (2, 4), (3, 5), (6, 8),
+        (2, 3), (4, 5), (6, 7),
+        (1, 2), (3, 4), (5, 6),
+    ],
+    10: [  # 29 comparators
+        (0, 8), (1, 9), (2, 7), (3, 5), (4, 6),
+        (0, 2), (1, 4), (5, 8), (7, 9),
+        (0, 3), (2, 4), (5, 7), (6, 9),
+        (0, 1), (3, 6), (8, 9),
+        (1, 5), (2, 3), (4, 8), (6, 7),
+        (1, 2), (3, 5), (4, 6), (7, 8),
+        (2, 3), (4, 5), (6, 7),
+        (3, 4), (5, 6),
+    ],
+    11: [  # 35 comparators
+        (0, 9), (1, 6), (2, 4), (3, 7), (5, 8),
+        (0, 1), (3, 5), (4, 10), (6, 9), (7, 8),
+        (1, 3), (2, 5), (4, 7), (8, 10),
+        (0, 4), (1, 2), (3, 7), (5, 9), (6, 8),
+        (0, 1), (2, 6), (4, 5), (7, 8), (9, 10),
+        (2, 4), (3, 6), (5, 7), (8, 9),
+        (1, 2), (3, 4), (5, 6), (7, 8),
+        (2, 3), (4, 5), (6, 7),
+    ],
+    12: [  # 39 comparators
+        (0, 8), (1, 7), (2, 6), (3, 11), (4, 10), (5, 9),
+        (0, 1), (2, 5), (3, 4), (6, 9), (7, 8), (10, 11),
+        (0, 2), (1, 6), (5, 10), (9, 11),
+        (0, 3), (1, 2), (4, 6), (5, 7), (8, 11), (9, 10),
+        (1, 4), (3, 5), (6, 8), (7, 10),
+        (1, 3), (2, 5), (6, 9), (8, 10),
+        (2, 3), (4, 5), (6, 7), (8, 9),
+        (4, 6), (5, 7),
+        (3, 4), (5, 6), (7, 8),
+    ],
+    13: [  # 45 comparators
+        (0, 12), (1, 10), (2, 9), (3, 7), (5, 11), (6, 8),
+        (1, 6), (2, 3), (4, 11), (7, 9), (8, 10),
+        (0, 4), (1, 2), (3, 6), (7, 8), (9, 10), (11, 12),
+        (4, 6), (5, 9), (8, 11), (10, 12),
+        (0, 5), (3, 8), (4, 7), (6, 11), (9, 10),
+        (0, 1), (2, 5), (6, 9), (7, 8), (10, 11),
+        (1, 3), (2, 4), (5, 6), (9, 10),
+        (1, 2), (3, 4), (5, 7), (6, 8),
+        (2, 3), (4, 5), (6, 7), (8, 9),
+        (3, 4), (5, 6),
+    ],
+    14: [  # 51 comparators
+        (0, 1), (2, 3), (4, 5), (6, 7), (8, 9), (10, 11), (12, 13),
+        (0, 2), (1, 3), (4, 8), (5, 9), (10, 12), (11, 13),
+        (0, 4), (1, 2), (3, 7), (5, 8), (6, 10), (9, 13), (11, 12),
+        (0, 6), (1, 5), (3, 9), (4, 10), (7, 13), (8, 12),
+        (2, 10), (3, 11), (4, 6), (7, 9),
+        (1, 3), (2, 8), (5, 11), (6, 7), (10, 12),
+        (1, 4), (2, 6), (3, 5), (7, 11), (8, 10), (9, 12),
+        (2, 4), (3, 6), (5, 8), (7, 10), (9, 11),
+        (3, 4), (5, 6), (7, 8), (9, 10),
+        (6, 7),
+    ],
+    15: [  # 56 comparators
+        (0, 13), (1, 12), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10),
+        (0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (11, 12),
+        (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13),
+        (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14),
+        (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14),
+        (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14),
+        (2, 4), (3, 6), (9, 12), (11, 13),
+        (3, 5), (6, 8), (7, 9), (10, 12),
+        (3, 4), (5, 6), (7, 8), (9, 10), (11, 12),
+        (6, 7), (8, 9),
+    ],
+    16: [  # 60 comparators
+        (0, 13), (1, 12), (2, 15), (3, 14), (4, 8), (5, 6), (7, 11), (9, 10),
+        (0, 5), (1, 7), (2, 9), (3, 4), (6, 13), (8, 14), (10, 15), (11, 12),
+        (0, 1), (2, 3), (4, 5), (6, 8), (7, 9), (10, 11), (12, 13), (14, 15),
+        (0, 2), (1, 3), (4, 10), (5, 11), (6, 7), (8, 9), (12, 14), (13, 15),
+        (1, 2), (3, 12), (4, 6), (5, 7), (8, 10), (9, 11), (13, 14),
+        (1, 4), (2, 6), (5, 8), (7, 10), (9, 13), (11, 14),
+        (2, 4), (3, 6), (9, 12), (11, 13),
+        (3, 5), (6, 8), (7, 9), (10, 12),
+        (3, 4), (5, 6), (7, 8), (9, 10), (11, 12),
+        (6, 7), (8, 9),
+    ],
+}
+
+# Lists up to this size can be sorted by a network
+MAX_NETWORK_SIZE = max(SORTING_NETWORKS)
+
+
+def build_network_sort(n, comparators):
+    """
+    Generate a fully unrolled function that sorts n values with a network.
+    
+    The generated code for n = 3 looks like this:
+    
+        def network_sort_3(values):
+            a0, a1, a2 = values
+            if a2 < a0: a0, a2 = a2, a0
+            if a1 < a0: a0, a1 = a1, a0
+            if a2 < a1: a1, a2 = a2, a1
+            return [a0, a1, a2]
+    
+    With no loops, no index arithmetic and every value in a local
+    variable, it avoids the per-step overhead of insertion_sort.
+    """
+    names = [f"a{i}" for i in range(n)]
+    lines = [f"def network_sort_{n}(values):",
+             f"    {', '.join(names)}, = values"]
+    for i, j in comparators:
+        lines.append(f"    if a{j} < a{i}: a{i}, a{j} = a{j}, a{i}")
+    lines.append(f"    return [{', '.join(names)}]")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace[f"network_sort_{n}"]
+
+
+# n -> generated function returning the n values as a new sorted list
+NETWORK_SORTS = {n: build_network_sort(n, comparators)
+                 for n, comparators in SORTING_NETWORKS.items()}
+NETWORK_SORTS[0] = list
+NETWORK_SORTS[1] = list
+
+
+def network_sort(arr):
+    """
+    Sort a list of at most 16 elements with an unrolled sorting network.
+    
+    Args:
+        arr: List of at most MAX_NETWORK_SIZE comparable elements
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    if len(arr) > MAX_NETWORK_SIZE:
+        raise ValueError(f"network_sort handles at most {MAX_NETWORK_SIZE} elements")
+    arr[:] = NETWORK_SORTS[len(arr)](arr)
+    return arr
+
+
+# ============================================================================
+# Non-Comparison Sorts for Numbers
+# ============================================================================
+
+# Inputs shorter than this are not worth the setup of a numeric sort
+NUMERIC_SORT_THRESHOLD = 64
+
+# Counting sort is used when (max - min) is at most this many times n
+# (measured: at 4n it loses to introsort below a few hundred elements)
+COUNTING_SORT_RANGE_FACTOR = 2
+
+# Radix sort is used only when 2 * (byte passes) <= n.bit_length() - this.
+# Each pass costs about as much as a few comparison levels, so radix only
+# wins when there are few passes compared with log2(n): measured, one pass
+# from n = 256, two from n = 1000, four from n = 10000.
+RADIX_SORT_LOG_MARGIN = 6
+
+
+def sort_numbers(arr, reverse=False):
+    """
+    Sort arr with a non-comparison sort if it holds only numbers.
+    
+    Integers use counting sort when their range is small compared to the
+    length of the list, and LSD radix sort when the range needs few byte
+    passes compared with log2(n). Everything else (wide ints, floats) is
+    left to the comparison sorts, which measured faster for those inputs.
+    
+    Args:
+        arr: List to be sorted (modified in-place)
+        reverse: Sort in descending order if True
+    
+    Returns:
+        True if arr was sorted, False if it needs a comparison sort
+    """
+    n = len(arr)
+    if n < NUMERIC_SORT_THRESHOLD:
+        return False
+    
+    # Under instrument() the elements are wrapped: decide on and sort the
+    # plain values, so the same algorithm runs as without metering
+    values = arr
+    if active_metrics is not None and type(arr[0]) is MeteredValue:
+        values = [item.value for item in arr]
+    
+    # Exact type checks: bool and int subclasses may order differently
+    types = set(map(type, values))
+    
+    if types == {int}:
+        value_range = max(values) - min(values)
+        if value_range <= COUNTING_SORT_RANGE_FACTOR * n:
+            counting_sort(values)
+        elif radix_pays_off(n, value_range):
+            radix_sort(values)
+        else:
+            return False
+    else:
+        return False
+    
+    if reverse:
+        values.reverse()
+    if values is not arr:
+        arr[:] = [MeteredValue(value) for value in values]
+    return True
+
+
+def counting_sort(arr):
+    """
+    Sort a list of integers using Counting Sort.
+    
+    Counts how often each value occurs, then writes the values back in
+    order. O(n + k) time and O(k) memory, where k = max - min + 1.
+    
+    Args:
+        arr: List of integers
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    if len(arr) < 2:
+        return arr
+    
+    if active_metrics is not None:
+        active_metrics.allocations += 1
+    
+    minimum = min(arr)
+    counts = [0] * (max(arr) - minimum + 1)
+    
+    # Count the occurrences of each value
+    for value in arr:
+        counts[value - minimum] += 1
+    
+    # Write every value back as many times as it occurred
+    position = 0
+    for offset, count in enumerate(counts):
+        if count:
+            arr[position:position + count] = [offset + minimum] * count
+            position += count
+    
+    return arr
+
+
+# Radix sort looks at one byte of the key per pass
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+
+
+def radix_pays_off(n, value_range):
+    """Check whether radix sort beats introsort for n ints spanning value_range."""
+    passes = -(-value_range.bit_length() // RADIX_BITS)  # Ceiling division
+    return 2 * passes <= n.bit_length() - RADIX_SORT_LOG_MARGIN
+
+
+def radix_sort(arr):
+    """
+    Sort a list of integers using LSD (least significant digit) Radix Sort.
+    
+    Distributes the values into 256 buckets by one byte at a time, lowest
+    byte first. Negative numbers are handled by sorting value - min, which
+    is never negative. O(n * w / 8) time for values spanning w bits.
+    
+    Args:
+        arr: List of integers
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    if len(arr) < 2:
+        return arr
+    
+    minimum = min(arr)
+    value_range = max(arr) - minimum
+    
+    values = arr
+    shift = 0
+    while value_range >> shift:
+        if active_metrics is not None:
+            active_metrics.allocations += 1  # One set of buckets per pass
+            active_metrics.moves += 2 * len(values)  # Into the buckets and back out
+        
+        buckets = [[] for _ in range(RADIX)]
+        
+        # Stable distribution by the current byte of (value - minimum)
+        for value in values:
+            buckets[((value - minimum) >> shift) & (RADIX - 1)].append(value)
+        
+        # Collect the buckets in order for the next pass
+        values = [value for bucket in buckets for value in bucket]
+        shift += RADIX_BITS
+    
+    arr[:] = values
+    return arr
+
+
+def bucket_sort(arr, bucket_count=None):
+    """
+    Sort a list of finite floats (or ints) using Bucket Sort.
+    
+    Spreads the values over equal-width buckets between min and max and
+    sorts each bucket. O(n) on average for evenly spread values, and still
+    O(n log n) if most values end up in one bucket.
+    
+    Args:
+        arr: List of finite numbers
+        bucket_count: Number of buckets (default: length of the list)
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    n = len(arr)
+    if n < 2:
+        return arr
+    
+    if bucket_count is None:
+        bucket_count = n
+    
+    minimum = min(arr)
+    value_range = max(arr) - minimum
+    if value_range == 0:
+        return arr
+    
+    if active_metrics is not None:
+        active_metrics.allocations += 1
+        active_metrics.moves += n  # Into the buckets
+    
+    # Under instrument() the buckets are metered too, to count their swaps
+    bucket_type = list if active_metrics is None else MeteredList
+    buckets = [bucket_type() for _ in range(bucket_count)]
+    
+    # Map each value to a bucket; the maximum lands in the last bucket
+    scale = bucket_count / value_range
+    last = bucket_count - 1
+    for value in arr:
+        index = int((value - minimum) * scale)
+        buckets[index if index < last else last].append(value)
+    
+    # Sort each bucket (usually tiny, so introsort just insertion-sorts it)
+    # and collect them in order
+    position = 0
+    for bucket in buckets:
+        introsort(bucket)
+        arr[position:position + len(bucket)] = bucket
+        position += len(bucket)
+    
+    return arr
+
+
+# ============================================================================
+# Array Backend (array.array, memoryview, numpy.ndarray)
+# ============================================================================
+
+# Our kind names mapped to NumPy's sort kinds
+NUMPY_SORT_KINDS = {
+    "stable": "stable",     # Stable, like merge_sort and tim_sort
+    "quick": "quicksort",   # Unstable introsort, like sort and quick_sort
+}
+
+
+def is_buffer_array(arr):
+    """Check whether arr is a typed array that sort_array can handle."""
+    if isinstance(arr, (array.array, memoryview)):
+        return True
+    return np is not None and isinstance(arr, np.ndarray)
+
+
+def sort_array(arr, kind="stable", reverse=False, key=None):
+    """
+    Sort a typed array (array.array, memoryview or numpy.ndarray) in-place.
+    
+    With NumPy installed the buffer is wrapped in an ndarray view (no copy)
+    and sorted by NumPy's compiled sort, with no per-element Python work.
+    A writable memoryview is sorted directly in the memory it points to.
+    Without NumPy, or with a key function (which NumPy can't run), the
+    values are copied to a list, sorted with the pure Python engine and
+    written back.
+    
+    Args:
+        arr: Writable 1-D typed array
+        kind: "stable" or "quick" (default: "stable")
+        reverse: Sort in descending order if True
+        key: Function computing the comparison key of each element
+            (sorting by key is always stable)
+    
+    Returns:
+        The same array, sorted
+    """
+    if kind not in NUMPY_SORT_KINDS:
+        raise ValueError(f"Unknown sort kind: {kind!r}")
+    
+    view = memoryview(arr)
+    if view.readonly:
+        raise TypeError("cannot sort a read-only buffer in-place")
+    if view.ndim != 1:
+        raise ValueError("only 1-D arrays can be sorted")
+    
+    if np is not None and key is None:
+        # Zero-copy ndarray over the same memory
+        values = arr if isinstance(arr, np.ndarray) else np.asarray(view)
+        values.sort(kind=NUMPY_SORT_KINDS[kind])
+        if reverse:
+            values[:] = values[::-1].copy()
+        return arr
+    
+    # Pure Python fallback (NumPy, when installed, still does the copies,
+    # since it reads formats such as big-endian ints that memoryview can't)
+    values = np.asarray(view).tolist() if np is not None else view.tolist()
+    if key is not None:
+        sort_by_key(values, sort, key, reverse)
+    else:
+        if kind == "stable":
+            tim_sort(values)
+        else:
+            sort(values)
+        if reverse:
+            values.reverse()
+    
+    if np is not None:
+        np.asarray(view)[:] = values
+    elif view.format in array.typecodes:
+        # Write back in one block copy
+        view[:] = array.array(view.format, values)
+    else:
+        for i, value in enumerate(values):
+            view[i] = value
+    return arr
+
+
+# ============================================================================
+# Parallel Merge Sort (multiple processes)
+# ============================================================================
+
+# Lists shorter than this are sorted in the current process
+PARALLEL_THRESHOLD = 100000
+
+# Range of values that fit in a signed 64-bit shared memory slot
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+
+def parallel_merge_sort(arr, workers=None):
+    """
+    Sort a large list using several processes.
+    
+    The list is split into one chunk per worker, the chunks are sorted in
+    a ProcessPoolExecutor, and the sorted chunks are combined with a k-way
+    heap merge. Lists of ints (64-bit) or floats are placed in shared
+    memory so the workers sort them in-place without pickling the data.
+    Stable, like merge_sort.
+    
+    Args:
+        arr: List of comparable elements
+        workers: Number of processes (default: number of CPUs)
+    
+    Returns:
+        New sorted list (does not modify original)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    
+    n = len(arr)
+    if workers < 2 or n < PARALLEL_THRESHOLD:
+        return tim_sort(list(arr))
+    
+    # Chunk boundaries: chunk i is arr[bounds[i]:bounds[i + 1]]
+    bounds = [n * i // workers for i in range(workers + 1)]
+    
+    typecode = shared_typecode(arr)
+    if typecode is not None:
+        chunks = sort_chunks_shared(arr, bounds, typecode, workers)
+    else:
+        pieces = [arr[bounds[i]:bounds[i + 1]] for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = list(executor.map(tim_sort, pieces))
+    
+    # merge_many takes from earlier chunks on ties, so the result is stable
+    return list(merge_many(*chunks))
+
+
+def shared_typecode(arr):
+    """
+    Return the array typecode for storing arr in shared memory, or None.
+    """
+    types = set(map(type, arr))
+    if types == {float}:
+        return "d"
+    if types == {int} and INT64_MIN <= min(arr) and max(arr) <= INT64_MAX:
+        return "q"
+    return None
+
+
+def sort_chunks_shared(arr, bounds, typecode, workers):
+    """
+    Sort the chunks of a numeric list in one shared memory block.
+    
+    Returns:
+        List of the sorted chunks, as Python lists
+    """
+    values = array.array(typecode, arr)
+    shm = shared_memory.SharedMemory(create=True, size=len(values) * values.itemsize)
+    try:
+        # The view must be released before shm.close(), even on errors,
+        # or close() raises BufferError and hides the original exception
+        view = shm.buf.cast(typecode)
+        try:
+            view[:] = values
+            
+            # Workers attach to the block by name and sort their own slice
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                jobs = [executor.submit(sort_shared_chunk, shm.name, typecode,
+                                        bounds[i], bounds[i + 1])
+                        for i in range(workers)]
+                for job in jobs:
+                    job.result()  # Re-raise any error from the worker
+            
+            return [view[bounds[i]:bounds[i + 1]].tolist() for i in range(workers)]
+        finally:
+            view.release()
+    finally:
+        try:
+            shm.close()
+        finally:
+            shm.unlink()  # Free the block even if close() failed
+
+
+def sort_shared_chunk(name, typecode, start, stop):
+    """
+    Worker: sort the slice [start:stop] of the shared memory block name.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        try:
+            chunk = view[start:stop]
+            try:
+                sort_array(chunk)
+            finally:
+                chunk.release()
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def benchmark_parallel_merge_sort(n=1000000, workers=None, repeat=1):
+    """
+    Compare parallel_merge_sort with the serial merge_sort.
+    
+    Args:
+        n: Number of elements to sort
+        workers: Number of processes (default: number of CPUs)
+        repeat: Runs per case; the best time is reported
+    
+    Returns:
+        Tuple (serial_seconds, parallel_seconds, speedup)
+    """
+    data = [random.randrange(n) for _ in range(n)]
+    
+    serial = best_time(merge_sort, data, repeat)
+    parallel = best_time(lambda arr: parallel_merge_sort(arr, workers), data, repeat)
+    speedup = serial / parallel
+    
+    print(f"\nSorting {n} integers with {workers or os.cpu_count()} workers")
+    print(f"merge_sort:          {serial:.3f} s")
+    print(f"parallel_merge_sort: {parallel:.3f} s")
+    print(f"Speedup:             {speedup:.1f}x")
+    
+    return serial, parallel, speedup
+
+
+# ============================================================================
+# Batch Sorting (many small lists in one call)
+# ============================================================================
+
+# Average list length from which the packed NumPy sort beats the per-list
+# loop; for shorter lists, packing and unpacking the values costs more than
+# the sorting networks (measured on 800000 ints or floats in total)
+SORT_SEGMENTS_MIN_AVERAGE = 128
+
+
+def sort_many(lists, key=None, reverse=False):
+    """
+    Sort every list in a list of lists, with one call instead of many.
+    
+    Each list is sorted in a tight loop that sends tiny lists straight to
+    their sorting network. With NumPy installed and lists that are long on
+    average (SORT_SEGMENTS_MIN_AVERAGE), lists of plain ints (64-bit) or
+    floats are instead packed into one ragged array (all values plus the
+    offset where each list starts) and every segment is sorted in a single
+    vectorized lexsort. Either way the result is the same as calling
+    sort(values, key=key, reverse=reverse) on each list.
+    
+    Args:
+        lists: List of lists to sort (each modified in-place)
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
+    
+    Returns:
+        The same list of lists, with every inner list sorted
+    """
+    total = sum(map(len, lists))
+    if key is None and np is not None and total >= SORT_SEGMENTS_MIN_AVERAGE * len(lists):
+        values = [value for values in lists for value in values]
+        typecode = shared_typecode(values) if values else None
+        if typecode is not None:
+            sort_segments(lists, values, typecode, reverse)
+            return lists
+    
+    # Pure Python: look up what each list needs without the checks in sort()
+    for values in lists:
+        if (key is None and not reverse and type(values) is list
+                and len(values) <= MAX_NETWORK_SIZE):
+            values[:] = NETWORK_SORTS[len(values)](values)
+        else:
+            sort(values, key=key, reverse=reverse)
+    return lists
+
+
+def sort_segments(lists, values, typecode, reverse=False):
+    """
+    Sort each list in place using one NumPy pass over the packed values.
+    
+    Args:
+        lists: The lists to sort
+        values: All their values, concatenated in order
+        typecode: "q" for 64-bit ints or "d" for floats
+        reverse: Sort each list in descending order if True
+    """
+    # Ragged array: flat values plus offsets[i] = start of list i
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    offsets = np.zeros(len(lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    flat = np.array(values, dtype=np.int64 if typecode == "q" else np.float64)
+    
+    # Sort by (segment, value): segments stay in place, values get sorted
+    segment_ids = np.repeat(np.arange(len(lists)), lengths)
+    sorted_values = flat[np.lexsort((flat, segment_ids))].tolist()
+    
+    for values, start, end in zip(lists, offsets[:-1].tolist(), offsets[1:].tolist()):
+        segment = sorted_values[start:end]
+        if reverse:
+            segment.reverse()
+        values[:] = segment
+
+
+# ============================================================================
+# Partial Sorting and Selection
+# ============================================================================
+
+def nth_element(arr, n, low=0, high=None):
+    """
+    Rearrange arr so that arr[n] is the element that would be there if the
+    whole array were sorted (quickselect).
+    
+    Afterwards every element before position n is <= arr[n] and every
+    element after it is >= arr[n]; the two sides are otherwise unordered.
+    Average O(n). Like introsort, it switches to heap sort if the pivots
+    keep being bad (introselect), so the worst case is O(n log n).
+    
+    Args:
+        arr: List to rearrange (modified in-place)
+        n: Position to select
+        low: Starting index (default: 0)
+        high: Ending index (default: length - 1)
+    
+    Returns:
+        The selected element arr[n]
+    """
+    if high is None:
+        high = len(arr) - 1
+    
+    if not low <= n <= high:
+        raise IndexError("nth_element index out of range")
+    
+    depth_limit = 2 * (high - low + 1).bit_length()
+    
+    while high - low + 1 > INSERTION_SORT_THRESHOLD:
+        if depth_limit == 0:
+            # Too many bad pivots: sorting the range guarantees O(n log n)
+            heap_sort(arr, low, high)
+            return arr[n]
+        depth_limit -= 1
+        
+        pivot_index = choose_pivot(arr, low, high)
+        arr[pivot_index], arr[high] = arr[high], arr[pivot_index]
+        
+        # 3-way partitioning stops early when n lands among the duplicates
+        lt, gt = partition_three_way(arr, low, high)
+        
+        # Only keep working on the side that contains position n
+        if n < lt:
+            high = lt - 1
+        elif n > gt:
+            low = gt + 1
+        else:
+            return arr[n]
+    
+    insertion_sort(arr, low, high)
+    return arr[n]
+
+
+def partial_sort(arr, k):
+    """
+    Put the k smallest elements, in sorted order, at the front of arr.
+    
+    Selects the k-th element first and then sorts only the first k, so
+    the cost is O(n + k log k) instead of a full O(n log n) sort. The
+    rest of the array is left in no particular order.
+    
+    Args:
+        arr: List to rearrange (modified in-place)
+        k: Number of smallest elements to sort into place
+    
+    Returns:
+        The list (in-place modification)
+    """
+    k = min(k, len(arr))
+    if k <= 0:
+        return arr
+    
+    nth_element(arr, k - 1)
+    introsort(arr, 0, k - 1)
+    return arr
+
+
+def top_k(iterable, k, key=None, smallest=False):
+    """
+    Return the k largest (or smallest) items of an iterable, best first.
+    
+    Streams the input through a heap that never holds more than k items,
+    so it runs in O(n log k) time and O(k) memory and works on inputs that
+    do not fit in memory. Equal items keep their input order.
+    
+    Args:
+        iterable: Any iterable of items
+        k: Number of items to return
+        key: Function computing the comparison key of each item
+        smallest: Return the k smallest items instead of the largest
+    
+    Returns:
+        List of at most k items, largest first (smallest first if smallest)
+    """
+    if k <= 0:
+        return []
+    
+    # The heap root is always the weakest of the items kept so far.
+    # Entries are (key, -index, item): among equal keys the latest item
+    # is the weakest, and the unique index means items are never compared.
+    heap = []
+    for index, item in enumerate(iterable):
+        item_key = item if key is None else key(item)
+        if smallest:
+            item_key = ReversedKey(item_key)
+        entry = (item_key, -index, item)
+        
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif heap[0] < entry:
+            # Better than the weakest kept item: replace it
+            heapq.heapreplace(heap, entry)
+    
+    # Strongest first (for ties, earliest first)
+    heap.sort(reverse=True)
+    return [item for _, _, item in heap]
+
+
+def merge_many(*iterables, key=None, reverse=False, unique=False):
+    """
+    Lazily merge any number of sorted iterables into one sorted stream.
+    
+    A generator: it holds only the current item of each input in a heap
+    (O(k) memory for k inputs), reads each input one item at a time, and
+    can be stopped at any point without reading the rest. Each item costs
+    O(log k). Stable: on equal keys, items from earlier inputs come first.
+    
+    Args:
+        *iterables: Iterables, each already sorted by key (descending if
+            reverse)
+        key: Function computing the comparison key of each item
+        reverse: The inputs are sorted in descending order
+        unique: Skip items whose key equals the key of the item before
+    
+    Yields:
+        The items of all inputs in sorted order
+    """
+    # Heap entries: [heap key, input number, item, key, iterator]. The
+    # input number is unique, so items themselves are never compared.
+    heap = []
+    for order, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            item_key = item if key is None else key(item)
+            heap_key = ReversedKey(item_key) if reverse else item_key
+            heap.append([heap_key, order, item, item_key, iterator])
+            break
+    heapq.heapify(heap)
+    
+    has_last = False
+    last_key = None
+    
+    while heap:
+        entry = heap[0]
+        item = entry[2]
+        item_key = entry[3]
+        iterator = entry[4]
+        
+        if not (unique and has_last and item_key == last_key):
+            yield item
+        has_last = True
+        last_key = item_key
+        
+        if len(heap) == 1 and not unique:
+            # Only one input left: pass the rest of it straight through
+            yield from iterator
+            return
+        
+        # Replace the yielded item by the next one from the same input
+        for item in iterator:
+            item_key = item if key is None else key(item)
+            entry[0] = ReversedKey(item_key) if reverse else item_key
+            entry[2] = item
+            entry[3] = item_key
+            heapq.heapreplace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)  # This input is used up
+
+
+class ReversedKey:
+    """
+    Wraps a key so that comparisons are reversed (larger counts as smaller).
+    Lets a min-heap act as a max-heap for keys that cannot be negated.
+    """
+    __slots__ = ("key",)
+    
+    def __init__(self, key):
+        self.key = key
+    
+    def __lt__(self, other):
+        return other.key < self.key
+    
+    def __eq__(self, other):
+        return self.key == other.key
+
+
+# ============================================================================
+# Sorted Container
+# ============================================================================
+
+# Target number of elements per sublist of a SortedList
+SORTED_LIST_LOAD = 1000
+
+
+class SortedList:
+    """
+    A list that keeps its elements sorted as they are added and removed.
+    
+    Instead of re-sorting after every batch of new data, elements are
+    inserted straight into place. The elements live in a list of short
+    sorted sublists (about SORTED_LIST_LOAD elements each) with:
+    - maxes: the largest element of every sublist, searched with bisect
+      to find the sublist an element belongs in
+    - index: a Fenwick tree (binary indexed tree) of sublist lengths, used
+      to turn positions into (sublist, offset) pairs and back
+    
+    add, remove, bisect and rank queries cost O(log n) searches plus a
+    short shift inside one sublist. Memory is about one pointer per
+    element, far less than a balanced tree that allocates a node object
+    (with child pointers) for every element.
+    
+    Elements must be mutually comparable; store (key, value) tuples to
+    sort by a key.
+    """
+    
+    def __init__(self, iterable=(), load=SORTED_LIST_LOAD):
+        self.load = load
+        self.lists = []
+        self.maxes = []
+        self.index = None  # Rebuilt lazily when the sublists change shape
+        self.length = 0
+        self.update(iterable)
+    
+    def __len__(self):
+        return self.length
+    
+    def __iter__(self):
+        for sublist in self.lists:
+            yield from sublist
+    
+    def __reversed__(self):
+        for sublist in reversed(self.lists):
+            yield from reversed(sublist)
+    
+    def __contains__(self, value):
+        pos = bisect.bisect_left(self.maxes, value)
+        if pos == len(self.maxes):
+            return False
+        sublist = self.lists[pos]
+        i = bisect.bisect_left(sublist, value)
+        return sublist[i] == value
+    
+    def __repr__(self):
+        return f"SortedList({list(self)})"
+    
+    def __getitem__(self, index):
+        """Element at a position, or a list of elements for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+            
+            # Walk the sublists from the first position onwards
+            pos, i = self.locate(start)
+            result = []
+            remaining = stop - start
+            while remaining > 0:
+                part = self.lists[pos][i:i + remaining]
+                result.extend(part)
+                remaining -= len(part)
+                pos += 1
+                i = 0
+            return result
+        
+        pos, i = self.locate(self.normalize_index(index))
+        return self.lists[pos][i]
+    
+    def __delitem__(self, index):
+        pos, i = self.locate(self.normalize_index(index))
+        self.delete_at(pos, i)
+    
+    def normalize_index(self, index):
+        """Turn a negative position into a positive one, checking bounds."""
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("SortedList index out of range")
+        return index
+    
+    def add(self, value):
+        """Insert value in sorted order (after any equal elements)."""
+        if not self.maxes:
+            self.lists.append([value])
+            self.maxes.append(value)
+            self.index = None
+            self.length = 1
+            return
+        
+        pos = bisect.bisect_right(self.maxes, value)
+        if pos == len(self.maxes):
+            # Larger than everything: append to the last sublist
+            pos -= 1
+            self.lists[pos].append(value)
+            self.maxes[pos] = value
+        else:
+            bisect.insort_right(self.lists[pos], value)
+        
+        self.length += 1
+        self.grow(pos)
+    
+    def update(self, iterable):
+        """Add every element of iterable."""
+        values = list(iterable)
+        if len(values) * 8 < self.length:
+            # A few new elements: insert them one by one
+            for value in values:
+                self.add(value)
+            return
+        
+        # Many new elements: cheaper to sort everything and rebuild
+        values.extend(self)
+        sort(values)
+        load = self.load
+        self.lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self.maxes = [sublist[-1] for sublist in self.lists]
+        self.index = None
+        self.length = len(values)
+    
+    def remove(self, value):
+        """Remove one occurrence of value; raise ValueError if missing."""
+        if not self.discard(value):
+            raise ValueError(f"{value!r} not in SortedList")
+    
+    def discard(self, value):
+        """Remove one occurrence of value if present; return True if removed."""
+        pos = bisect.bisect_left(self.maxes, value)
+        if pos == len(self.maxes):
+            return False
+        sublist = self.lists[pos]
+        i = bisect.bisect_left(sublist, value)
+        if sublist[i] != value:
+            return False
+        self.delete_at(pos, i)
+        return True
+    
+    def pop(self, index=-1):
+        """Remove and return the element at a position (default: the largest)."""
+        pos, i = self.locate(self.normalize_index(index))
+        value = self.lists[pos][i]
+        self.delete_at(pos, i)
+        return value
+    
+    def bisect_left(self, value):
+        """Position where value would be inserted before any equal elements."""
+        pos = bisect.bisect_left(self.maxes, value)
+        if pos == len(self.maxes):
+            return self.length
+        return self.position(pos, bisect.bisect_left(self.lists[pos], value))
+    
+    def bisect_right(self, value):
+        """Position where value would be inserted after any equal elements."""
+        pos = bisect.bisect_right(self.maxes, value)
+        if pos == len(self.maxes):
+            return self.length
+        return self.position(pos, bisect.bisect_right(self.lists[pos], value))
+    
+    bisect = bisect_right
+    
+    def rank(self, value):
+        """Number of elements smaller than value."""
+        return self.bisect_left(value)
+    
+    def count(self, value):
+        """Number of elements equal to value."""
+        return self.bisect_right(value) - self.bisect_left(value)
+    
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True)):
+        """
+        Iterate over the elements between minimum and maximum, in order.
+        
+        Args:
+            minimum: Lower bound (None: from the smallest element)
+            maximum: Upper bound (None: up to the largest element)
+            inclusive: Pair of bools, whether each bound is included
+        
+        Yields:
+            The elements in the range
+        """
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+        
+        if maximum is None:
+            stop = self.length
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+        
+        if start >= stop:
+            return
+        
+        pos, i = self.locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            part = self.lists[pos][i:i + remaining]
+            yield from part
+            remaining -= len(part)
+            pos += 1
+            i = 0
+    
+    def grow(self, pos):
+        """After an insert into sublist pos, split it if it got too long."""
+        sublist = self.lists[pos]
+        if len(sublist) > 2 * self.load:
+            half = sublist[self.load:]
+            del sublist[self.load:]
+            self.lists.insert(pos + 1, half)
+            self.maxes[pos] = sublist[-1]
+            self.maxes.insert(pos + 1, half[-1])
+            self.index = None
+        elif self.index is not None:
+            self.index_add(pos, 1)
+    
+    def delete_at(self, pos, i):
+        """Delete element i of sublist pos, merging sublists that get too short."""
+        sublist = self.lists[pos]
+        del sublist[i]
+        self.length -= 1
+        
+        if not sublist:
+            del self.lists[pos]
+            del self.maxes[pos]
+            self.index = None
+        elif len(sublist) < self.load // 2 and len(self.lists) > 1:
+            # Join the short sublist with a neighbour (re-split if too long)
+            if pos == 0:
+                pos = 1
+            self.lists[pos - 1].extend(self.lists[pos])
+            self.maxes[pos - 1] = self.lists[pos - 1][-1]
+            del self.lists[pos]
+            del self.maxes[pos]
+            self.index = None
+            self.grow(pos - 1)
+        else:
+            self.maxes[pos] = sublist[-1]
+            if self.index is not None:
+                self.index_add(pos, -1)
+    
+    # Positional index: Fenwick tree over the sublist lengths.
+    # tree[i] holds the total length of a block of sublists ending at i
+    # (1-based), so prefix sums and lookups take O(log m) for m sublists.
+    
+    def build_index(self):
+        """Build the Fenwick tree from the current sublist lengths."""
+        tree = [0] + [len(sublist) for sublist in self.lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.index = tree
+    
+    def index_add(self, pos, delta):
+        """Add delta to the length recorded for sublist pos."""
+        tree = self.index
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+    
+    def position(self, pos, i):
+        """Turn (sublist pos, offset i) into a position in the whole list."""
+        if self.index is None:
+            self.build_index()
+        tree = self.index
+        total = i
+        while pos > 0:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+    
+    def locate(self, index):
+        """Turn a position in the whole list into (sublist pos, offset)."""
+        if index < len(self.lists[0]):
+            return 0, index  # Common case: no index needed
+        if self.index is None:
+            self.build_index()
+        tree = self.index
+        
+        # Descend the tree: find how many whole sublists fit before index
+        pos = 0
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            next_pos = pos + step
+            if next_pos < len(tree) and tree[next_pos] <= index:
+                pos = next_pos
+                index -= tree[next_pos]
+            step >>= 1
+        return pos, index
+
+
+# ============================================================================
+# Presortedness Metrics and Algorithm Planning
+# ============================================================================
+
+# Decisions of plan_sort are logged here; configure logging (for example
+# logging.basicConfig(level=logging.INFO)) to see them
+logger = logging.getLogger(__name__)
+
+# Random pairs compared by estimate_inversions
+INVERSION_SAMPLES = 1024
+
+# plan_sort only trusts the sampled inversion estimate for insertion sort
+# up to this size; beyond it a missed inversion costs too much
+PLANNER_INSERTION_MAX = 4096
+
+# Average run length from which tim_sort's run merging pays off
+PLANNER_MIN_AVERAGE_RUN = 32
+
+
+def is_sorted(arr, key=None, reverse=False):
+    """
+    Check whether arr is already sorted, in O(n) with early exit.
+    
+    Args:
+        arr: Sequence to check
+        key: Function computing the comparison key of each element
+        reverse: Check for descending order instead
+    
+    Returns:
+        True if no element is smaller (larger if reverse) than the one before
+    """
+    keys = arr if key is None else [key(item) for item in arr]
+    if reverse:
+        return not any(map(operator.lt, keys, keys[1:]))
+    return not any(map(operator.lt, keys[1:], keys))
+
+
+def descents(arr):
+    """
+    Return the positions i where arr[i] < arr[i - 1] (where a run breaks).
+    
+    The comparisons run in C through map(), so this is a fast O(n) pass.
+    """
+    return list(itertools.compress(range(1, len(arr)), map(operator.lt, arr[1:], arr)))
+
+
+def run_count(arr):
+    """Number of maximal non-decreasing runs in arr (1 if sorted, 0 if empty)."""
+    if not arr:
+        return 0
+    return len(descents(arr)) + 1
+
+
+def longest_run(arr):
+    """Length of the longest non-decreasing run of consecutive elements."""
+    if not arr:
+        return 0
+    bounds = [0] + descents(arr) + [len(arr)]
+    return max(bounds[i + 1] - bounds[i] for i in range(len(bounds) - 1))
+
+
+def estimate_inversions(arr, samples=INVERSION_SAMPLES, seed=None):
+    """
+    Estimate the number of inversions (pairs i < j with arr[j] < arr[i]).
+    
+    Counting them exactly takes O(n log n); instead random pairs are
+    checked and the fraction that is out of order is scaled up to all
+    n * (n - 1) / 2 pairs. 0 means sorted, about half of all pairs means
+    random order, all pairs means reversed.
+    
+    Args:
+        arr: Sequence to measure
+        samples: Number of random pairs to check
+        seed: Seed for the random pairs (for repeatable estimates)
+    
+    Returns:
+        Estimated number of inversions
+    """
+    n = len(arr)
+    pairs = n * (n - 1) // 2
+    if pairs == 0:
+        return 0
+    
+    # Draw all indices at once: much cheaper than a randrange() per index
+    picks = random.Random(seed).choices(range(n), k=2 * samples)
+    inverted = 0
+    for i, j in zip(picks[::2], picks[1::2]):
+        if i > j:
+            i, j = j, i
+        if arr[j] < arr[i]:
+            inverted += 1
+    
+    # Pairs with i == j are never inverted; leave them out of the fraction
+    return min(pairs, round(pairs * inverted / samples * n / (n - 1)))
+
+
+def presortedness(arr, samples=INVERSION_SAMPLES, seed=None):
+    """
+    Measure how disordered arr is.
+    
+    Args:
+        arr: Sequence to measure
+        samples: Random pairs for the inversion estimate (0: skip it)
+        seed: Seed for the random pairs
+    
+    Returns:
+        Dict with size, sorted, runs, longest_run and inversions (estimated,
+        or None if skipped)
+    """
+    n = len(arr)
+    breaks = descents(arr)
+    bounds = [0] + breaks + [n]
+    return {
+        "size": n,
+        "sorted": not breaks,
+        "runs": len(breaks) + 1 if n else 0,
+        "longest_run": max(bounds[i + 1] - bounds[i] for i in range(len(bounds) - 1)),
+        "inversions": (0 if not breaks else
+                       estimate_inversions(arr, samples, seed) if samples else None),
+    }
+
+
+def plan_sort(arr, seed=None):
+    """
+    Choose a sorting algorithm for arr from how disordered it is.
+    
+    Rules, checked in order:
+    1. Already sorted: nothing to do
+    2. Tiny: insertion_sort
+    3. Long runs on average: tim_sort (merges the existing runs)
+    4. Small with few inversions: insertion_sort (O(n + inversions))
+    5. Otherwise: sort (hybrid introsort engine)
+    
+    Inversions are only sampled when rule 4 is reached, so large inputs
+    are planned with a single O(n) pass. The decision and the metrics
+    behind it are logged at INFO level.
+    
+    Args:
+        arr: List to be sorted (not modified)
+        seed: Seed for the inversion sampling
+    
+    Returns:
+        Tuple (algorithm name, metrics dict from presortedness); the name
+        is "none" or a key of PLANNER_ALGORITHMS
+    """
+    metrics = presortedness(arr, samples=0)
+    n = metrics["size"]
+    
+    if metrics["sorted"]:
+        choice, reason = "none", "already sorted"
+    elif n <= INSERTION_SORT_THRESHOLD:
+        choice, reason = "insertion_sort", "tiny input"
+    elif n // metrics["runs"] >= PLANNER_MIN_AVERAGE_RUN:
+        choice, reason = "tim_sort", "long runs"
+    else:
+        if n <= PLANNER_INSERTION_MAX:
+            metrics["inversions"] = estimate_inversions(arr, seed=seed)
+        if metrics["inversions"] is not None and metrics["inversions"] <= n:
+            choice, reason = "insertion_sort", "few inversions"
+        else:
+            choice, reason = "sort", "no exploitable order"
+    
+    logger.info("plan_sort: size=%d runs=%d longest_run=%d inversions~%s -> %s (%s)",
+                n, metrics["runs"], metrics["longest_run"], metrics["inversions"],
+                choice, reason)
+    return choice, metrics
+
+
+def adaptive_sort(arr, key=None, reverse=False, seed=None):
+    """
+    Sort arr with the algorithm plan_sort picks for it.
+    
+    Args:
+        arr: List of comparable elements
+        key: Function computing the comparison key of each element
+        reverse: Sort in descending order if True
+        seed: Seed for the inversion sampling
+    
+    Returns:
+        Sorted list (in-place modification)
+    """
+    if key is not None or reverse:
+        return sort_by_key(arr, partial(adaptive_sort, seed=seed), key, reverse)
+    
+    choice, _ = plan_sort(arr, seed)
+    if choice != "none":
+        PLANNER_ALGORITHMS[choice](arr)
+    return arr
+
+
+# Algorithms plan_sort can choose, all sorting in-place
+PLANNER_ALGORITHMS = {
+    "insertion_sort": insertion_sort,
+    "tim_sort": tim_sort,
+    "sort": sort,
+}
+
+
+# ============================================================================
+# Instrumentation (opt-in metrics)
+# ============================================================================
+
+# Metrics of the instrument() call in progress; None means switched off.
+# Algorithms only touch this outside their inner loops (to count buffer
+# allocations), so leaving it off costs nothing measurable.
+active_metrics = None
+
+
+class SortMetrics:
+    """
+    Counters collected while instrument() runs a sort.
+    
+    Attributes:
+        comparisons: Comparisons between elements (or between keys)
+        swaps: Pairs of writes that exchanged two elements of the list
+        moves: Element writes into the list being sorted or into the lists
+            and buffers the algorithm copies elements into (swaps count as 2)
+        max_depth: Deepest nesting of Python calls into this module, i.e.
+            recursion depth. Sorts that keep their own explicit stack
+            (quick_sort, merge_sort_bottom_up) report a small constant
+        allocations: Auxiliary lists and buffers created by the algorithm
+    """
+    
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0
+        self.moves = 0
+        self.max_depth = 0
+        self.allocations = 0
+        self.depth = 0  # Current call depth, used to update max_depth
+    
+    def as_dict(self):
+        """Return the counters as a dictionary."""
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "moves": self.moves,
+            "max_depth": self.max_depth,
+            "allocations": self.allocations,
+        }
+    
+    def __repr__(self):
+        counters = ", ".join(f"{name}={value}" for name, value in self.as_dict().items())
+        return f"SortMetrics({counters})"
+
+
+class MeteredValue:
+    """
+    Wraps an element (or key) and counts every comparison it takes part in.
+    """
+    __slots__ = ("value",)
+    
+    def __init__(self, value):
+        self.value = value
+    
+    def __lt__(self, other):
+        active_metrics.comparisons += 1
+        return self.value < other.value
+    
+    def __le__(self, other):
+        active_metrics.comparisons += 1
+        return self.value <= other.value
+    
+    def __gt__(self, other):
+        active_metrics.comparisons += 1
+        return self.value > other.value
+    
+    def __ge__(self, other):
+        active_metrics.comparisons += 1
+        return self.value >= other.value
+    
+    def __eq__(self, other):
+        active_metrics.comparisons += 1
+        return self.value == other.value
+    
+    __hash__ = None
+    
+    def __repr__(self):
+        return repr(self.value)
+
+
+class MeteredList(list):
+    """
+    List that counts element writes (moves) and detects swaps.
+    
+    A swap "arr[i], arr[j] = arr[j], arr[i]" is two writes where the second
+    puts back the element the first one replaced.
+    """
+    
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self.last_write = None  # (new element, replaced element) of the last write
+    
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+            active_metrics.moves += len(value)
+            self.last_write = None
+            super().__setitem__(index, value)
+            return
+        
+        replaced = super().__getitem__(index)
+        super().__setitem__(index, value)
+        active_metrics.moves += 1
+        
+        last = self.last_write
+        if last is not None and value is last[1] and replaced is last[0]:
+            active_metrics.swaps += 1
+            self.last_write = None
+        else:
+            self.last_write = (value, replaced)
+
+
+def metered_key(key, item):
+    """Key wrapper used by instrument() to count comparisons between keys."""
+    return MeteredValue(key(item))
+
+
+def unwrap(value):
+    """Return the plain value inside a MeteredValue (or value itself)."""
+    return value.value if type(value) is MeteredValue else value
+
+
+# Code of the instrumentation helpers themselves, ignored by track_depth
+METERING_CODE = {
+    func.__code__
+    for func in [metered_key, unwrap, *vars(MeteredValue).values(), *vars(MeteredList).values()]
+    if hasattr(func, "__code__")
+}
+
+
+def track_depth(frame, event, arg):
+    """Profile hook: track how deeply calls into this module are nested."""
+    if frame.f_code.co_filename != __file__ or frame.f_code in METERING_CODE:
+        return
+    if event == "call":
+        active_metrics.depth += 1
+        if active_metrics.depth > active_metrics.max_depth:
+            active_metrics.max_depth = active_metrics.depth
+    elif event == "return":
+        active_metrics.depth -= 1
+
+
+def instrument(func, arr, *args, wrap=True, **kwargs):
+    """
+    Run func(arr, *args, **kwargs) and count what the sort does.
+    
+    The elements (or the keys, if a key function is given) are wrapped to
+    count comparisons, the list is replaced by a MeteredList to count
+    moves and swaps, and a profile hook tracks call depth. None of this
+    exists when instrument() is not used, so normal calls pay nothing.
+    sort() and sort_by_key() look through the wrappers, so they take the
+    same path (network, numeric or key sort) as an unmetered call.
+    
+    Args:
+        func: Sort function to run
+        arr: List to sort (sorted in-place if func sorts in-place)
+        *args, **kwargs: Extra arguments for func
+        wrap: Wrap elements to count comparisons; use False for the
+            numeric sorts, which need plain numbers
+    
+    Returns:
+        Tuple (sorted list, SortMetrics)
+    """
+    global active_metrics
+    metrics = SortMetrics()
+    
+    key = kwargs.get("key")
+    if key is not None:
+        # Count comparisons between keys; the elements stay untouched
+        kwargs["key"] = partial(metered_key, key)
+        wrap = False
+    
+    items = MeteredList(MeteredValue(value) for value in arr) if wrap else MeteredList(arr)
+    
+    previous_profile = sys.getprofile()
+    active_metrics = metrics
+    sys.setprofile(track_depth)
+    try:
+        result = func(items, *args, **kwargs)
+    finally:
+        sys.setprofile(previous_profile)
+        active_metrics = None
+    
+    sorted_values = items if result is None else result
+    if wrap:
+        sorted_values = [item.value for item in sorted_values]
+    
+    # In-place sorts write their result back into the caller's list
+    if result is None or result is items:
+        arr[:] = sorted_values
+        return arr, metrics
+    return list(sorted_values), metrics
+
+
+# Benchmark functions
+def benchmark_three_way_partition(n=10000, distinct_values=(10, 100, 10000), repeat=3):
+    """
+    Compare 2-way and 3-way quick sort on inputs with few distinct values.
+    
+    Args:
+        n: Number of elements in each input
+        distinct_values: Number of distinct keys to test
+        repeat: Runs per case; the best time is reported
+    
+    Returns:
+        List of (distinct, two_way_seconds, three_way_seconds) tuples
+    """
+    results = []
+    
+    print(f"\n{'Distinct':>10s} {'2-way (s)':>12s} {'3-way (s)':>12s} {'Speedup':>10s}")
+    for distinct in distinct_values:
+        data = [random.randrange(distinct) for _ in range(n)]
+        
+        two_way = best_time(lambda arr: quick_sort(arr), data, repeat)
+        three_way = best_time(lambda arr: quick_sort(arr, three_way=True), data, repeat)
+        
+        results.append((distinct, two_way, three_way))
+        print(f"{distinct:>10d} {two_way:>12.4f} {three_way:>12.4f} {two_way / three_way:>9.1f}x")
+    
+    return results
+
+
+def benchmark_block_partition(n=100000, repeat=3):
+    """
+    Compare block partitioning with the Lomuto scheme of partition.
+    
+    Args:
+        n: Number of elements in each input
+        repeat: Runs per case; the best time is reported
+    
+    Returns:
+        List of (data_type, lomuto_seconds, block_seconds) tuples
+    """
+    inputs = {
+        "int": [random.randrange(n * 10) for _ in range(n)],
+        "float": [random.random() for _ in range(n)],
+        "str": [f"{random.randrange(n * 10):08d}" for _ in range(n)],
+    }
+    results = []
+    
+    print(f"\n{'Type':>10s} {'Lomuto (s)':>12s} {'Block (s)':>12s} {'Speedup':>10s}")
+    for data_type, data in inputs.items():
+        lomuto = best_time(lambda arr: quick_sort(arr), data, repeat)
+        block = best_time(lambda arr: quick_sort(arr, block=True), data, repeat)
+        
+        results.append((data_type, lomuto, block))
+        print(f"{data_type:>10s} {lomuto:>12.4f} {block:>12.4f} {lomuto / block:>9.1f}x")
+    
+    return results
+
+
+def benchmark_sorting_networks(sizes=(2, 4, 8, 12, 16), calls=100000):
+    """
+    Compare the per-call cost of network_sort and insertion_sort on tiny lists.
+    
+    Args:
+        sizes: List sizes to test (at most MAX_NETWORK_SIZE)
+        calls: Number of lists sorted per size
+    
+    Returns:
+        List of (size, insertion_microseconds, network_microseconds) tuples
+    """
+    results = []
+    
+    print(f"\n{'Size':>6s} {'Insertion (us)':>15s} {'Network (us)':>13s} {'Saved (us)':>11s}")
+    for size in sizes:
+        lists = [[random.random() for _ in range(size)] for _ in range(calls)]
+        
+        per_call = []
+        for func in (insertion_sort, network_sort):
+            copies = [list(values) for values in lists]
+            start = time.perf_counter()
+            for values in copies:
+                func(values)
+            per_call.append((time.perf_counter() - start) / calls * 1e6)
+        
+        insertion, network = per_call
+        results.append((size, insertion, network))
+        print(f"{size:>6d} {insertion:>15.3f} {network:>13.3f} {insertion - network:>11.3f}")
+    
+    return results
+
+
+def benchmark_sorted_list(n=200000, batch=100):
+    """
+    Compare keeping data sorted with SortedList against a plain list.
+    
+    Values arrive in batches; after each batch the plain list is kept
+    sorted with bisect.insort (O(n) shifting per insert) and the
+    SortedList with add.
+    
+    Args:
+        n: Total number of values added
+        batch: Number of values arriving together
+    
+    Returns:
+        Tuple (insort_seconds, sorted_list_seconds)
+    """
+    data = [random.random() for _ in range(n)]
+    
+    start = time.perf_counter()
+    plain = []
+    for i in range(0, n, batch):
+        for value in data[i:i + batch]:
+            bisect.insort(plain, value)
+    insort_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    container = SortedList()
+    for i in range(0, n, batch):
+        for value in data[i:i + batch]:
+            container.add(value)
+    sorted_list_time = time.perf_counter() - start
+    
+    assert list(container) == plain
+    print(f"\n{'Structure':>12s} {'Time (s)':>10s}")
+    print(f"{'insort':>12s} {insort_time:>10.4f}")
+    print(f"{'SortedList':>12s} {sorted_list_time:>10.4f}")
+    return insort_time, sorted_list_time
+
+
+def best_time(func, data, repeat=3):
+    """
+    Return the fastest of several runs of func on fresh copies of data.
+    """
+    times = []
+    for _ in range(repeat):
+        arr_copy = list(data)
+        start = time.perf_counter()
+        func(arr_copy)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    # The full suite (more sizes, JSON/CSV output) is sorting_benchmark.py
+    from sorting_benchmark import print_header, run_benchmarks
+    
+    print("Sorting Algorithms Benchmark")
+    print("="*60)
+    print_header()
+    run_benchmarks(sizes=(10, 100), repeat=1)
+    
+    print("\n\n" + "="*60)
+    print("Individual Algorithm Examples")
+    print("="*60)
+    
+    # Example 1: Bubble Sort
+    numbers1 = [64, 34, 25, 12, 22, 11, 90]
+    print(f"\nBubble Sort:")
+    print(f"Original: {numbers1}")
+    bubble_sort(numbers1)
+    print(f"Sorted:   {numbers1}")
+    
+    # Example 2: Selection Sort
+    numbers2 = [64, 25, 12, 22, 11]
+    print(f"\nSelection Sort:")
+    print(f"Original: {numbers2}")
+    selection_sort(numbers2)
+    print(f"Sorted:   {numbers2}")
+    
+    # Example 3: Insertion Sort
+    numbers3 = [64, 34, 25, 12, 22, 11, 90]
+    print(f"\nInsertion Sort:")
+    print(f"Original: {numbers3}")
+    insertion_sort(numbers3)
+    print(f"Sorted:   {numbers3}")
+    
+    # Example 4: Merge Sort
+    numbers4 = [38, 27, 43, 3, 9, 82, 10]
+    print(f"\nMerge Sort:")
+    print(f"Original: {numbers4}")
+    sorted4 = merge_sort(numbers4)
+    print(f"Sorted:   {sorted4}")
+    print(f"Original unchanged: {numbers4}")
+    
+    # Example 5: Quick Sort
+    numbers5 = [10, 7, 8, 9, 1, 5]
+    print(f"\nQuick Sort:")
+    print(f"Original: {numbers5}")
+    quick_sort(numbers5)
+    print(f"Sorted:   {numbers5}")
+    
+    # Example 6: Quick Sort Simple
+    numbers6 = [10, 7, 8, 9, 1, 5]
+    print(f"\nQuick Sort (Simple):")
+    print(f"Original: {numbers6}")
+    sorted6 = quick_sort_simple(numbers6)
+    print(f"Sorted:   {sorted6}")
+    
+    # Example 7: Heap Sort
+    numbers7 = [12, 11, 13, 5, 6, 7]
+    print(f"\nHeap Sort:")
+    print(f"Original: {numbers7}")
+    heap_sort(numbers7)
+    print(f"Sorted:   {numbers7}")
+    
+    # Example 8: Radix Sort with negative numbers
+    numbers8 = [170, -45, 75, -90, 802, 24, 2, 66]
+    print(f"\nRadix Sort:")
+    print(f"Original: {numbers8}")
+    radix_sort(numbers8)
+    print(f"Sorted:   {numbers8}")
+    
+    # Example 9: Bucket Sort for floats
+    numbers9 = [0.42, 0.32, 0.23, 0.52, 0.25, 0.47, 0.51]
+    print(f"\nBucket Sort:")
+    print(f"Original: {numbers9}")
+    bucket_sort(numbers9)
+    print(f"Sorted:   {numbers9}")
+    
+    # Example 10: Top-k and partial sort
+    numbers10 = [38, 27, 43, 3, 9, 82, 10]
+    print(f"\nTop 3 (largest): {top_k(numbers10, 3)}")
+    print(f"Top 3 (smallest): {top_k(numbers10, 3, smallest=True)}")
+    partial_sort(numbers10, 3)
+    print(f"Partial sort (k=3): {numbers10}")
+    
+    # Example 11: Merging several sorted lists
+    shards = [[1, 4, 9], [2, 4, 8], [3, 5, 7]]
+    print(f"\nMerge many {shards}:")
+    print(f"Merged:        {list(merge_many(*shards))}")
+    print(f"Merged unique: {list(merge_many(*shards, unique=True))}")
+    
+    # Example 12: Sorting many small lists at once
+    rows = [[3, 1, 2], [9, 7, 8, 6], [5], []]
+    print(f"\nSort many {rows}:")
+    sort_many(rows)
+    print(f"Sorted:        {rows}")
+    
+    # Example 13: Keeping arriving data sorted
+    arrivals = SortedList([38, 27, 43, 3])
+    for value in [9, 82, 10]:
+        arrivals.add(value)
+    print(f"\nSortedList after arrivals: {arrivals}")
+    print(f"Rank of 27: {arrivals.rank(27)}, values in [9, 40]: {list(arrivals.irange(9, 40))}")
+    
+    # Example 14: Hybrid Sort with key and reverse
+    words = ["banana", "Apple", "cherry", "date"]
+    print(f"\nHybrid Sort (key=str.lower, reverse=True):")
+    print(f"Original: {words}")
+    sort(words, key=str.lower, reverse=True)
+    print(f"Sorted:   {words}")
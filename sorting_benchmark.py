@@ -0,0 +1,340 @@
+"""
+Sorting Benchmark Suite
+Reproducible measurements for every sorting function in sorting_algorithms.py
+
+For each algorithm, input distribution and size it records:
+- wall time (best of several runs)
+- comparisons, swaps, element moves, call depth and buffer allocations
+  (from sorting_algorithms.instrument)
+- peak memory allocated while sorting (tracemalloc)
+
+Results can be written as JSON and/or CSV to compare runs across commits.
+
+Usage:
+    python sorting_benchmark.py
+    python sorting_benchmark.py --sizes 10 1000 100000 --json results.json --csv results.csv
+    python sorting_benchmark.py --algorithms sort tim_sort --distributions random sorted
+"""
+
+import argparse
+import csv
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import sorting_algorithms as sa
+
+
+# ============================================================================
+# Algorithms under test
+# ============================================================================
+
+# name -> (function, largest size to run it on)
+# Quadratic sorts are capped so a full run finishes in reasonable time,
+# and bucket_sort because it creates one list per element.
+ALGORITHMS = {
+    "bubble_sort": (sa.bubble_sort, 10000),
+    "selection_sort": (sa.selection_sort, 10000),
+    "insertion_sort": (sa.insertion_sort, 10000),
+    "merge_sort": (sa.merge_sort, 10 ** 7),
+    "merge_sort_bottom_up": (sa.merge_sort_bottom_up, 10 ** 7),
+    "tim_sort": (sa.tim_sort, 10 ** 7),
+    "quick_sort": (sa.quick_sort, 10 ** 7),
+    "quick_sort_3way": (lambda arr: sa.quick_sort(arr, three_way=True), 10 ** 7),
+    "quick_sort_simple": (sa.quick_sort_simple, 10 ** 6),
+    "heap_sort": (sa.heap_sort, 10 ** 7),
+    "sort": (sa.sort, 10 ** 7),
+    "adaptive_sort": (sa.adaptive_sort, 10 ** 7),
+    "counting_sort": (sa.counting_sort, 10 ** 7),
+    "radix_sort": (sa.radix_sort, 10 ** 7),
+    "bucket_sort": (sa.bucket_sort, 10 ** 6),
+    "parallel_merge_sort": (sa.parallel_merge_sort, 10 ** 7),
+    "builtin_sorted": (sorted, 10 ** 7),
+}
+
+# The numeric sorts need plain numbers, so their comparisons (there are
+# none) are not counted by wrapping the elements
+NUMERIC_ONLY = {"counting_sort", "radix_sort", "bucket_sort"}
+
+# The parallel sort does its work in other processes, out of sight of
+# the metrics hook
+UNCOUNTABLE = {"parallel_merge_sort"}
+
+# (name, distribution) -> largest size, for inputs known to blow up below
+# the limit in ALGORITHMS:
+# - sawtooth has 8 equal teeth, so the evenly spaced ninther samples all
+#   hold equal values and the median pivot goes quadratic (quick_sort has
+#   no heap sort fallback, unlike sort)
+# - quick_sort_simple also goes quadratic on organ_pipe, and above 10**4
+#   both inputs exceed Python's recursion limit
+# - counting_sort on random data needs a counts list 10 times the input
+DISTRIBUTION_MAX_SIZES = {
+    ("quick_sort", "sawtooth"): 10 ** 4,
+    ("quick_sort_3way", "sawtooth"): 10 ** 4,
+    ("quick_sort_simple", "sawtooth"): 10 ** 4,
+    ("quick_sort_simple", "organ_pipe"): 10 ** 4,
+    ("counting_sort", "random"): 10 ** 6,
+}
+
+
+# ============================================================================
+# Input distributions
+# ============================================================================
+
+def random_data(n, rng):
+    """Uniformly random integers."""
+    return [rng.randrange(n * 10 + 1) for _ in range(n)]
+
+
+def sorted_data(n, rng):
+    """Already sorted: 0, 1, 2, ..."""
+    return list(range(n))
+
+
+def reversed_data(n, rng):
+    """Sorted in reverse: n-1, n-2, ..., 0"""
+    return list(range(n - 1, -1, -1))
+
+
+def few_unique_data(n, rng):
+    """Random values drawn from only 10 distinct keys."""
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def sawtooth_data(n, rng):
+    """Several ascending runs: 0..k, 0..k, ... (8 teeth)"""
+    tooth = max(1, n // 8)
+    return [i % tooth for i in range(n)]
+
+
+def organ_pipe_data(n, rng):
+    """Ascending first half, descending second half: 0, 1, ..., 1, 0"""
+    half = n // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+DISTRIBUTIONS = {
+    "random": random_data,
+    "sorted": sorted_data,
+    "reversed": reversed_data,
+    "few_unique": few_unique_data,
+    "sawtooth": sawtooth_data,
+    "organ_pipe": organ_pipe_data,
+}
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+
+# Counting wraps every element, which is slow; skip it above this size
+COUNT_MAX_SIZE = 100000
+
+# Result fields, in CSV column order
+FIELDS = ["algorithm", "distribution", "size", "seconds", "comparisons",
+          "swaps", "moves", "max_depth", "allocations", "peak_memory_bytes"]
+
+
+# ============================================================================
+# Measurements
+# ============================================================================
+
+def run_sort(func, arr):
+    """Run func on arr and return the sorted list, in-place or not."""
+    result = func(arr)
+    return arr if result is None else result
+
+
+def measure_time(name, func, data, expected, repeat):
+    """
+    Return the best wall time of func over repeat runs on copies of data,
+    checking that every run produces the expected result.
+    """
+    best = None
+    for _ in range(repeat):
+        arr = list(data)
+        start = time.perf_counter()
+        result = run_sort(func, arr)
+        elapsed = time.perf_counter() - start
+        if list(result) != expected:
+            raise AssertionError(f"{name} returned an unsorted result")
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def measure_counts(name, func, data):
+    """
+    Return the counters (comparisons, swaps, ...) for func sorting data.
+    """
+    numeric = name in NUMERIC_ONLY
+    _, metrics = sa.instrument(func, list(data), wrap=not numeric)
+    counts = metrics.as_dict()
+    if numeric:
+        counts["comparisons"] = None
+    return counts
+
+
+def measure_peak_memory(func, data):
+    """Return the peak number of bytes allocated while func sorts data."""
+    arr = list(data)
+    tracemalloc.start()
+    try:
+        run_sort(func, arr)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmarks(algorithms=None, distributions=None, sizes=DEFAULT_SIZES,
+                   repeat=3, seed=0, count=True, memory=True):
+    """
+    Benchmark algorithms on every distribution and size.
+    
+    The same seed always produces the same inputs, so results from
+    different commits can be compared directly.
+    
+    Args:
+        algorithms: Names from ALGORITHMS (default: all)
+        distributions: Names from DISTRIBUTIONS (default: all)
+        sizes: Input sizes to test
+        repeat: Timed runs per case; the best time is recorded
+        seed: Seed for the random input generators
+        count: Count comparisons, swaps etc. (sizes up to COUNT_MAX_SIZE)
+        memory: Measure peak memory with tracemalloc
+    
+    Returns:
+        List of result dicts with the keys in FIELDS
+    """
+    algorithms = list(algorithms or ALGORITHMS)
+    distributions = list(distributions or DISTRIBUTIONS)
+    results = []
+    
+    for distribution in distributions:
+        for size in sizes:
+            # One input per (distribution, size), shared by every algorithm
+            rng = random.Random(f"{seed}-{distribution}-{size}")
+            data = DISTRIBUTIONS[distribution](size, rng)
+            expected = sorted(data)
+            
+            for name in algorithms:
+                func, max_size = ALGORITHMS[name]
+                max_size = DISTRIBUTION_MAX_SIZES.get((name, distribution), max_size)
+                if size > max_size:
+                    continue
+                
+                result = {
+                    "algorithm": name,
+                    "distribution": distribution,
+                    "size": size,
+                    "seconds": measure_time(name, func, data, expected, repeat),
+                    "comparisons": None,
+                    "swaps": None,
+                    "moves": None,
+                    "max_depth": None,
+                    "allocations": None,
+                    "peak_memory_bytes": None,
+                }
+                if count and name not in UNCOUNTABLE and size <= COUNT_MAX_SIZE:
+                    result.update(measure_counts(name, func, data))
+                if memory:
+                    result["peak_memory_bytes"] = measure_peak_memory(func, data)
+                
+                results.append(result)
+                print_result(result)
+    
+    return results
+
+
+# ============================================================================
+# Output
+# ============================================================================
+
+def print_header():
+    """Print the column titles for print_result."""
+    print(f"{'Algorithm':22s} {'Distribution':12s} {'Size':>9s} {'Time (s)':>10s} "
+          f"{'Comparisons':>13s} {'Swaps':>11s} {'Peak memory':>12s}")
+    print("-" * 95)
+
+
+def print_result(result):
+    """Print one result as a table row."""
+    comparisons = result["comparisons"]
+    swaps = result["swaps"]
+    peak = result["peak_memory_bytes"]
+    print(f"{result['algorithm']:22s} {result['distribution']:12s} {result['size']:>9d} "
+          f"{result['seconds']:>10.5f} "
+          f"{comparisons if comparisons is not None else '-':>13} "
+          f"{swaps if swaps is not None else '-':>11} "
+          f"{peak if peak is not None else '-':>12}")
+
+
+def environment_info(seed):
+    """Describe where the results came from, for comparing across commits."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    
+    return {
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def write_json(results, path, seed=0):
+    """Write results plus environment info to a JSON file."""
+    with open(path, "w") as f:
+        json.dump({"environment": environment_info(seed), "results": results}, f, indent=2)
+
+
+def write_csv(results, path):
+    """Write results to a CSV file, one row per measurement."""
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="input sizes (up to 10**7)")
+    parser.add_argument("--algorithms", nargs="+", choices=list(ALGORITHMS),
+                        help="algorithms to run (default: all)")
+    parser.add_argument("--distributions", nargs="+", choices=list(DISTRIBUTIONS),
+                        help="input distributions (default: all)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case; the best is recorded")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the inputs")
+    parser.add_argument("--no-count", action="store_true",
+                        help="skip counting comparisons, swaps etc.")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip measuring peak memory")
+    parser.add_argument("--json", help="write results to this JSON file")
+    parser.add_argument("--csv", help="write results to this CSV file")
+    args = parser.parse_args(argv)
+    
+    print_header()
+    results = run_benchmarks(args.algorithms, args.distributions, args.sizes,
+                             repeat=args.repeat, seed=args.seed,
+                             count=not args.no_count, memory=not args.no_memory)
+    
+    if args.json:
+        write_json(results, args.json, args.seed)
+        print(f"\nWrote {len(results)} results to {args.json}")
+    if args.csv:
+        write_csv(results, args.csv)
+        print(f"Wrote {len(results)} results to {args.csv}")
+
+
+if __name__ == "__main__":
+    main()